@@ -2,9 +2,9 @@ import os
 import json
 from collections import Counter
 import csv
-import matplotlib
-matplotlib.use("Agg")  # GitHub Actions 같은 headless 환경용
-import matplotlib.pyplot as plt
+
+import metrics_history
+from findings_diff import finding_fingerprint, dedupe_findings
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 REPORTS_DIR = os.path.join(BASE_DIR, "reports")
@@ -14,8 +14,8 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # -------------------- 데이터 로더 -------------------- #
 
-def load_tfsec():
-    path = os.path.join(REPORTS_DIR, "tfsec-report", "tfsec.json")
+def load_tfsec(reports_dir=REPORTS_DIR):
+    path = os.path.join(reports_dir, "tfsec-report", "tfsec.json")
     if not os.path.exists(path):
         print(f"[tfsec] 파일 없음: {path}")
         return Counter(), []
@@ -51,8 +51,8 @@ def load_tfsec():
     return counts, details
 
 
-def load_sonarcloud():
-    path = os.path.join(REPORTS_DIR, "sonarcloud-report", "sonarcloud.json")
+def load_sonarcloud(reports_dir=REPORTS_DIR):
+    path = os.path.join(reports_dir, "sonarcloud-report", "sonarcloud.json")
     if not os.path.exists(path):
         print(f"[SonarCloud] 파일 없음: {path}")
         return Counter(), []
@@ -126,16 +126,21 @@ def _zap_determine_severity(alert, code_map):
     return "UNKNOWN"
 
 
-def _zap_get_alert_url(alert):
-    """ZAP alert에서 대표 URL 하나 추출"""
+def _zap_alert_instances(alert):
+    """ZAP alert의 instance 목록 → [(uri, "METHOD param")] (instance 없으면 alert url 하나)"""
     url = alert.get("url", "")
     inst = alert.get("instances") or []
-    if inst and isinstance(inst, list):
-        return inst[0].get("uri", url)
-    return url
-
-def load_zap():
-    path = os.path.join(REPORTS_DIR, "zap-report", "report_json.json")
+    if not (inst and isinstance(inst, list)):
+        return [(url, "")]
+    out = []
+    for i in inst:
+        method = (i.get("method") or "").upper()
+        param = i.get("param") or ""
+        out.append((i.get("uri", url), f"{method} {param}".strip()))
+    return out
+
+def load_zap(reports_dir=REPORTS_DIR):
+    path = os.path.join(reports_dir, "zap-report", "report_json.json")
     if not os.path.exists(path):
         print(f"[ZAP] 파일 없음: {path}")
         return Counter(), []
@@ -143,7 +148,6 @@ def load_zap():
     with open(path, "r") as f:
         data = json.load(f)
 
-    counts = Counter()
     details = []
 
     sites = data.get("site") or data.get("sites") or []
@@ -162,18 +166,21 @@ def load_zap():
 
             # 🔽 복잡한 로직 helper로 분리 → Cognitive Complexity 감소
             sev = _zap_determine_severity(alert, code_map)
-            url = _zap_get_alert_url(alert)
 
-            counts[sev] += 1
-
-            details.append({
-                "tool": "zap",
-                "severity": sev,
-                "rule_id": plugin_id,
-                "message": name,
-                "target": url,
-                "location": "",
-            })
+            # instance 단위로 펼친 뒤 fingerprint 로 중복 제거
+            # (같은 URL 의 query 값만 다른 instance, 여러 site 에 반복된 alert 등)
+            for url, location in _zap_alert_instances(alert):
+                details.append({
+                    "tool": "zap",
+                    "severity": sev,
+                    "rule_id": plugin_id,
+                    "message": name,
+                    "target": url,
+                    "location": location,
+                })
+
+    details = dedupe_findings(details)
+    counts = Counter(d["severity"] for d in details)
 
     print("[ZAP] severity counts:", dict(counts))
     return counts, details
@@ -199,10 +206,11 @@ def write_csv(all_tools_counts, csv_path):
 def write_detailed_csv(all_details, csv_path):
     """
     all_details: [{tool, severity, rule_id, message, target, location}, ...]
+    fingerprint: run 간 비교용 안정 id (findings_diff.py 참고)
     """
     with open(csv_path, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(["tool", "severity", "rule_id", "target", "location", "message"])
+        writer.writerow(["tool", "severity", "rule_id", "target", "location", "message", "fingerprint"])
         for d in all_details:
             writer.writerow([
                 d.get("tool", ""),
@@ -211,6 +219,7 @@ def write_detailed_csv(all_details, csv_path):
                 d.get("target", ""),
                 d.get("location", ""),
                 d.get("message", "").replace("\n", " "),
+                d.get("fingerprint") or finding_fingerprint(d),
             ])
     print(f"[CSV] 상세 저장 완료: {csv_path}")
 
@@ -250,7 +259,19 @@ ZAP_COLOR_MAP = {
     "UNKNOWN": "#d0d0d0",
 }
 
-plt.style.use("ggplot")
+_plt = None
+
+
+def _pyplot():
+    """matplotlib 은 그래프를 그릴 때만 import (게이트만 돌릴 때는 로딩 비용 없음)"""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use("Agg")  # GitHub Actions 같은 headless 환경용
+        import matplotlib.pyplot as plt
+        plt.style.use("ggplot")
+        _plt = plt
+    return _plt
 
 
 def ordered_items(counts: Counter):
@@ -281,6 +302,7 @@ def plot_bar(tool_name, counts):
 
     colors = [palette.get(sev, "#999999") for sev in labels]
 
+    plt = _pyplot()
     plt.figure(figsize=(6, 4))
 
     # 막대 너비를 조금 줄임
@@ -331,6 +353,7 @@ def plot_combined_severity(all_tools_counts):
 
     colors = [COLOR_MAP.get(sev, "#999999") for sev in labels]
 
+    plt = _pyplot()
     plt.figure(figsize=(6, 4))
     bars = plt.bar(labels, values, color=colors)
     plt.title("Combined Severity Distribution (All Tools)")
@@ -357,10 +380,15 @@ def plot_combined_severity(all_tools_counts):
 def plot_findings_by_tool(all_tools_counts):
     tools = list(all_tools_counts.keys())
     counts = [sum(c.values()) for c in all_tools_counts.values()]
+    if not any(counts):
+        # finding 이 하나도 없으면 pie chart 를 그릴 수 없음
+        print("[by tool] 데이터 없음, 그래프 스킵")
+        return
 
     # 도구별 고정 색상
     tool_colors = ["#fc8d59", "#d7301f", "#91bfdb"]  # tfsec, sonarcloud, zap
 
+    plt = _pyplot()
     plt.figure(figsize=(10, 4))  # 가로로 배치
 
     # ---------------------
@@ -405,39 +433,92 @@ def plot_findings_by_tool(all_tools_counts):
 
     print(f"[PNG] 저장 완료: {out_path}")
 
+
+def plot_trend(last_n=30):
+    """히스토리 DB 의 run 별 롤업(run_totals)만 읽어서 추세 그래프 생성"""
+    run_ids, series = metrics_history.severity_trend(last_n)
+    if len(run_ids) < 2:
+        print("[trend] run 2개 미만, 그래프 스킵")
+        return
+
+    x = list(range(len(run_ids)))
+
+    plt = _pyplot()
+    plt.figure(figsize=(10, 4))
+    for sev in SEVERITY_ORDER:
+        if sev in series:
+            plt.plot(x, series[sev], marker="o", label=sev, color=COLOR_MAP.get(sev, "#999999"))
+
+    plt.title(f"Severity Trend (last {len(run_ids)} runs)", fontweight="bold")
+    plt.xlabel("Run")
+    plt.ylabel("Findings")
+    # run id 가 길어서 짧게 표시
+    plt.xticks(x, [r[-10:] for r in run_ids], rotation=45, ha="right", fontsize=7)
+    plt.legend(fontsize=8)
+
+    out_path = os.path.join(OUTPUT_DIR, "severity_trend.png")
+    plt.tight_layout()
+    plt.savefig(out_path)
+    plt.close()
+    print(f"[PNG] 저장 완료: {out_path}")
+
 # -------------------- main -------------------- #
 
-def main():
-    tfsec_counts, tfsec_details = load_tfsec()
-    sonar_counts, sonar_details = load_sonarcloud()
-    zap_counts, zap_details = load_zap()
+def collect(reports_dir=REPORTS_DIR):
+    """세 툴 리포트 로드 → (all_tools_counts, all_details)"""
+    tfsec_counts, tfsec_details = load_tfsec(reports_dir)
+    sonar_counts, sonar_details = load_sonarcloud(reports_dir)
+    zap_counts, zap_details = load_zap(reports_dir)
 
     all_tools = {
         "tfsec": tfsec_counts,
         "sonarcloud": sonar_counts,
         "zap": zap_counts,
     }
+    all_details = tfsec_details + sonar_details + zap_details
+    return all_tools, all_details
 
+
+def write_csvs(all_tools, all_details):
     # CSV 생성
     csv_path = os.path.join(OUTPUT_DIR, "metrics.csv")
     write_csv(all_tools, csv_path)
-    
+
     # 상세용 CSV
     detailed_path = os.path.join(OUTPUT_DIR, "metrics_detailed.csv")
-    all_details = tfsec_details + sonar_details + zap_details
     write_detailed_csv(all_details, detailed_path)
 
+
+def write_charts(all_tools):
     # 개별 그래프
-    plot_bar("sonarcloud", sonar_counts)
-    plot_bar("tfsec", tfsec_counts)
-    plot_bar("zap", zap_counts)
+    plot_bar("sonarcloud", all_tools["sonarcloud"])
+    plot_bar("tfsec", all_tools["tfsec"])
+    plot_bar("zap", all_tools["zap"])
 
     # 통합 그래프
     plot_combined_severity(all_tools)
     plot_findings_by_tool(all_tools)
+    plot_trend()
+
+
+def main():
+    all_tools, all_details = collect()
+
+    write_csvs(all_tools, all_details)
+
+    # 히스토리 DB 에 이번 run 누적 (CSV 는 덮어쓰기라 추세를 볼 수 없음)
+    metrics_history.record_run(all_tools)
+
+    write_charts(all_tools)
 
     print("\n[✓] metrics_output 디렉터리 생성 완료")
 
 
 if __name__ == "__main__":
-    main()
+    import sys
+    import profile_hooks
+
+    # --profile[=cprofile|tracemalloc] 또는 THESIS_PROFILE 환경변수
+    profile_mode, sys.argv[1:] = profile_hooks.pop_profile_flag(sys.argv[1:])
+    with profile_hooks.profiled("analyze_security", profile_mode):
+        main()
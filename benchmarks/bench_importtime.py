@@ -0,0 +1,97 @@
+"""
+Cold-start import 시간 측정 (python -X importtime 요약).
+
+    python benchmarks/bench_importtime.py
+    python benchmarks/bench_importtime.py --runs 5 --top 15 --out metrics_output/benchmarks/importtime.json
+
+대상:
+  wsgi   : import thesis.wsgi  (gunicorn 워커 부팅과 동일)
+  check  : python manage.py check
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+TARGETS = {
+    "wsgi": [sys.executable, "-X", "importtime", "-c", "import thesis.wsgi"],
+    "check": [sys.executable, "-X", "importtime", "manage.py", "check"],
+}
+# 지연 import 대상 — 부팅 시 로딩되면 회귀
+WATCHED = ("boto3", "botocore", "cryptography", "dotenv", "matplotlib")
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def run_once(cmd):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="thesis.settings", PYTHONPATH=ROOT_DIR)
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed:\n{proc.stderr[-2000:]}")
+
+    total_us = 0
+    by_package = {}   # 최상위 패키지 이름 → self time 합계 (어느 깊이에서 import 됐든)
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        self_us, name = int(m.group(1)), m.group(4)
+        total_us += self_us
+        root = name.split(".")[0]
+        by_package[root] = by_package.get(root, 0) + self_us
+    return wall, total_us, by_package
+
+
+def summarize(name, cmd, runs, top):
+    walls, totals, merged = [], [], {}
+    for _ in range(runs):
+        wall, total_us, by_package = run_once(cmd)
+        walls.append(wall)
+        totals.append(total_us)
+        for pkg, us in by_package.items():
+            merged.setdefault(pkg, []).append(us)
+
+    packages = sorted(((statistics.median(v), k) for k, v in merged.items()), reverse=True)
+    result = {
+        "target": name,
+        "wall_ms": round(statistics.median(walls) * 1000, 1),
+        "import_ms": round(statistics.median(totals) / 1000, 1),
+        "top_packages_ms": {k: round(us / 1000, 1) for us, k in packages[:top]},
+        "watched_loaded": sorted(k for k in merged if k in WATCHED),
+    }
+
+    print(f"[{name}] wall {result['wall_ms']} ms, imports {result['import_ms']} ms (median of {runs})")
+    for pkg, ms in result["top_packages_ms"].items():
+        print(f"    {ms:>8.1f} ms  {pkg}")
+    if result["watched_loaded"]:
+        print(f"    ! 부팅 시 로딩된 지연 대상: {', '.join(result['watched_loaded'])}")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="import-time cold start benchmark")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = [summarize(name, cmd, args.runs, args.top) for name, cmd in TARGETS.items()]
+
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"[importtime] 결과 저장: {args.out}")
+    return 1 if any(r["watched_loaded"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+PII 암호문 형식 마이크로 벤치마크: Fernet vs AES-GCM envelope.
+
+    python benchmarks/bench_pii_cipher.py --rows 20000
+
+필드 4개(email, full_name, phone, address)로 된 row 기준
+encrypt/decrypt 처리량(rows/s)과 row 당 저장 bytes 를 비교한다.
+"""
+import os
+import sys
+import time
+import argparse
+
+from cryptography.fernet import Fernet
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from django.conf import settings  # noqa: E402
+
+settings.configure(ENCRYPTION_ENABLED=True, FERNET_KEY=Fernet.generate_key().decode(), PII_CIPHER="aesgcm")
+
+from experiment import crypto  # noqa: E402
+
+SAMPLE_ROW = {
+    "email": "jiyoung.kim@example.com",
+    "full_name": "Jiyoung Kim",
+    "phone": "0871234567",
+    "address": "12 Example Street, Dublin 2",
+}
+
+
+def bench(cipher, rows):
+    settings.PII_CIPHER = cipher
+    values = list(SAMPLE_ROW.values())
+
+    start = time.perf_counter()
+    encrypted = [[crypto.encrypt(v) for v in values] for _ in range(rows)]
+    enc_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row in encrypted:
+        for v in row:
+            crypto.decrypt(v)
+    dec_s = time.perf_counter() - start
+
+    return {
+        "cipher": cipher,
+        "encrypt_rows_per_s": rows / enc_s,
+        "decrypt_rows_per_s": rows / dec_s,
+        "bytes_per_row": sum(len(v) for v in encrypted[0]),
+        "plaintext_bytes_per_row": sum(len(v) for v in values),
+        "max_field": max(encrypted[0], key=len),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PII cipher micro-benchmark")
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    print(f"{'cipher':<8} {'enc rows/s':>12} {'dec rows/s':>12} {'bytes/row':>10} {'plain':>6} {'longest field':>14}")
+    for cipher in ("fernet", "aesgcm"):
+        r = bench(cipher, args.rows)
+        print(f"{r['cipher']:<8} {r['encrypt_rows_per_s']:>12.0f} {r['decrypt_rows_per_s']:>12.0f} "
+              f"{r['bytes_per_row']:>10} {r['plaintext_bytes_per_row']:>6} {len(r['max_field']):>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+보안 지표 파이프라인 벤치마크 (load / CSV write / plot / gate 단계별 wall time + peak memory).
+
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 100000
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 --compare metrics_output/benchmarks/baseline.json
+
+결과는 metrics_output/benchmarks/results-<timestamp>.json 로 저장되고,
+--compare 로 이전 결과와 비교해 threshold 이상 느려진 단계가 있으면 exit 1.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+import subprocess
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import analyze_security  # noqa: E402
+import quality_gate  # noqa: E402
+from generate_reports import generate  # noqa: E402
+
+BENCH_DIR = os.path.join(ROOT_DIR, "metrics_output", "benchmarks")
+DATA_DIR = os.path.join(BENCH_DIR, "data")
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+# 너무 짧은 단계는 노이즈가 커서 회귀 판정에서 제외
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+@contextlib.contextmanager
+def _quiet():
+    """loader / writer 의 print 출력 숨기기"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def _output_dir(path):
+    """plot_* 가 쓰는 analyze_security.OUTPUT_DIR 을 잠시 바꿨다가 원래대로 (벤치 후 같은 프로세스에 남지 않게)"""
+    saved = analyze_security.OUTPUT_DIR
+    analyze_security.OUTPUT_DIR = path
+    try:
+        yield
+    finally:
+        analyze_security.OUTPUT_DIR = saved
+
+
+def measure(fn, with_memory=True):
+    """fn 실행 → (결과, wall 초, peak MiB). peak 는 tracemalloc 으로 한 번 더 실행해서 측정."""
+    with _quiet():
+        start = time.perf_counter()
+        result = fn()
+        wall = time.perf_counter() - start
+
+        peak_mib = None
+        if with_memory:
+            tracemalloc.start()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mib = round(peak / (1024 * 1024), 2)
+    return result, round(wall, 4), peak_mib
+
+
+def reports_for(size, seed=0):
+    """size 별 합성 리포트 (한 번 만든 건 재사용)"""
+    out_dir = os.path.join(DATA_DIR, f"{size}-seed{seed}")
+    marker = os.path.join(out_dir, ".complete")
+    if not os.path.exists(marker):
+        print(f"[bench] 합성 리포트 생성: {size} findings → {out_dir}")
+        generate(size, out_dir, seed)
+        open(marker, "w").close()
+    return out_dir
+
+
+def bench_size(size, work_dir, policy, with_memory=True, with_plot=True):
+    reports_dir = reports_for(size)
+    results = []
+
+    def record(stage, fn):
+        value, wall, peak = measure(fn, with_memory)
+        results.append({"size": size, "stage": stage, "wall_s": wall, "peak_mib": peak})
+        peak_txt = f"{peak:.1f} MiB" if peak is not None else "-"
+        print(f"  {stage:<10} {wall:>9.3f}s  {peak_txt:>12}")
+        return value
+
+    all_tools, all_details = record("load", lambda: analyze_security.collect(reports_dir))
+
+    csv_path = os.path.join(work_dir, "metrics.csv")
+    detailed_path = os.path.join(work_dir, "metrics_detailed.csv")
+
+    def write_csvs():
+        analyze_security.write_csv(all_tools, csv_path)
+        analyze_security.write_detailed_csv(all_details, detailed_path)
+    record("csv_write", write_csvs)
+
+    if with_plot:
+        analyze_security._pyplot()  # matplotlib import 비용은 측정에서 제외
+
+        def plot():
+            for tool, counts in all_tools.items():
+                analyze_security.plot_bar(tool, counts)
+            analyze_security.plot_combined_severity(all_tools)
+            analyze_security.plot_findings_by_tool(all_tools)
+        with _output_dir(work_dir):
+            record("plot", plot)
+
+    record("gate", lambda: quality_gate.build_verdict(all_tools, all_details, policy))
+    record("gate_csv", lambda: quality_gate.evaluate_findings(
+        quality_gate.iter_detailed_csv(detailed_path), policy))
+
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results, baseline_path, threshold):
+    """baseline 대비 wall time 비율 출력. 회귀(threshold 초과) 개수 반환."""
+    with open(baseline_path, "r") as f:
+        baseline = {(r["size"], r["stage"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\n[compare] baseline: {baseline_path} (threshold x{threshold})")
+    for r in results:
+        old = baseline.get((r["size"], r["stage"]))
+        if not old:
+            continue
+        ratio = r["wall_s"] / old["wall_s"] if old["wall_s"] else float("inf")
+        flag = ""
+        if ratio > threshold and max(r["wall_s"], old["wall_s"]) >= MIN_COMPARABLE_SECONDS:
+            flag = "  ← REGRESSION"
+            regressions += 1
+        print(f"  {r['size']:>8} {r['stage']:<10} {old['wall_s']:>9.3f}s → {r['wall_s']:>9.3f}s  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보안 지표 파이프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="전체 finding 수 목록 (1000 ~ 1000000)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc peak 측정 생략")
+    parser.add_argument("--no-plot", action="store_true", help="그래프 단계 생략")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: metrics_output/benchmarks/results-<ts>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="회귀로 볼 wall time 배율")
+    args = parser.parse_args(argv)
+
+    policy = quality_gate.load_policy()
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            print(f"[bench] {size} findings")
+            results += bench_size(size, work_dir, policy,
+                                  with_memory=not args.no_memory, with_plot=not args.no_plot)
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_path = args.out or os.path.join(BENCH_DIR, f"results-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w") as f:
+        json.dump({
+            "meta": {
+                "created_at": stamp,
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"[bench] 결과 저장: {out_path}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+합성(synthetic) tfsec / SonarCloud / ZAP 리포트 생성기.
+
+analyze_security.py 가 읽는 reports/ 디렉터리 구조 그대로 만든다:
+    <out_dir>/tfsec-report/tfsec.json
+    <out_dir>/sonarcloud-report/sonarcloud.json
+    <out_dir>/zap-report/report_json.json
+
+    python benchmarks/generate_reports.py 100000 --out-dir /tmp/reports-100k
+"""
+import os
+import sys
+import json
+import random
+import argparse
+
+# 전체 finding 중 툴별 비율
+TOOL_SHARE = {"tfsec": 0.2, "sonarcloud": 0.5, "zap": 0.3}
+
+TFSEC_SEVERITIES = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+SONAR_SEVERITIES = ["BLOCKER", "CRITICAL", "MAJOR", "MINOR", "INFO"]
+ZAP_RISKS = [("0", "Informational"), ("1", "Low"), ("2", "Medium"), ("3", "High")]
+
+SONAR_MESSAGES = [
+    "Refactor this function to reduce its Cognitive Complexity from {n} to the 15 allowed.",
+    "This loop's stop condition tests \"i\" but the incrementer updates \"j\".",
+    "Remove this unused import of '{name}'.",
+    "Define a constant instead of duplicating this literal {n} times.",
+]
+ZAP_ALERTS = [
+    'Server Leaks Version Information via "Server" HTTP Response Header Field',
+    "CSP: Failure to Define Directive with No Fallback",
+    "GET for POST",
+    "Cross Site Scripting (Reflected)",
+    "SQL Injection",
+    "Missing Anti-clickjacking Header",
+]
+ZAP_INSTANCES_PER_ALERT = 10
+
+
+def _split(total):
+    counts = {tool: int(total * share) for tool, share in TOOL_SHARE.items()}
+    counts["sonarcloud"] += total - sum(counts.values())
+    return counts
+
+
+def _write_json_array(f, items):
+    """큰 리스트를 메모리에 올리지 않고 한 항목씩 기록"""
+    f.write("[")
+    for i, item in enumerate(items):
+        if i:
+            f.write(",\n")
+        f.write(json.dumps(item))
+    f.write("]")
+
+
+def _tfsec_results(n, rnd):
+    for i in range(n):
+        start = rnd.randint(1, 400)
+        yield {
+            "rule_id": f"AVD-AWS-{i % 97:04d}",
+            "long_id": f"aws-service-check-{i % 97}",
+            "severity": rnd.choice(TFSEC_SEVERITIES),
+            "description": f"Resource does not enable recommended setting #{i % 97}",
+            "location": {
+                "filename": f"infra/terraform/module_{i % 50}/main.tf",
+                "start_line": start,
+                "end_line": start + rnd.randint(0, 20),
+            },
+        }
+
+
+def _sonar_issues(n, n_components, rnd):
+    for i in range(n):
+        yield {
+            "key": f"issue-{i}",
+            "rule": f"python:S{1000 + i % 300}",
+            "severity": rnd.choice(SONAR_SEVERITIES),
+            "message": rnd.choice(SONAR_MESSAGES).format(n=rnd.randint(16, 60), name=f"mod{i % 40}"),
+            "component": f"Thesis:comp{i % n_components}",
+            "line": rnd.randint(1, 2000),
+            "status": "RESOLVED" if i % 20 == 0 else "OPEN",
+        }
+
+
+def _zap_alerts(n, rnd):
+    n_alerts = (n + ZAP_INSTANCES_PER_ALERT - 1) // ZAP_INSTANCES_PER_ALERT
+    remaining = n
+    for a in range(n_alerts):
+        code, desc = rnd.choice(ZAP_RISKS)
+        k = min(ZAP_INSTANCES_PER_ALERT, remaining)
+        remaining -= k
+        yield {
+            "pluginId": str(10000 + a % 500),
+            "name": ZAP_ALERTS[a % len(ZAP_ALERTS)],
+            "riskcode": code,
+            "riskdesc": f"{desc} (Medium)",
+            "instances": [
+                {"uri": f"http://localhost:8000/page{a}/{j}?q={j}", "method": "GET", "param": f"p{j % 3}"}
+                for j in range(k)
+            ],
+        }
+
+
+def generate(total, out_dir, seed=0):
+    """total 개 finding 을 툴별로 나눠 out_dir 아래에 기록. 반환: 툴별 개수"""
+    rnd = random.Random(seed)
+    counts = _split(total)
+
+    tfsec_dir = os.path.join(out_dir, "tfsec-report")
+    os.makedirs(tfsec_dir, exist_ok=True)
+    with open(os.path.join(tfsec_dir, "tfsec.json"), "w") as f:
+        f.write('{"results": ')
+        _write_json_array(f, _tfsec_results(counts["tfsec"], rnd))
+        f.write("}")
+
+    n_components = max(1, counts["sonarcloud"] // 25)
+    sonar_dir = os.path.join(out_dir, "sonarcloud-report")
+    os.makedirs(sonar_dir, exist_ok=True)
+    with open(os.path.join(sonar_dir, "sonarcloud.json"), "w") as f:
+        f.write('{"components": ')
+        _write_json_array(f, (
+            {"key": f"Thesis:comp{c}", "path": f"experiment/module_{c}.py"} for c in range(n_components)
+        ))
+        f.write(', "issues": ')
+        _write_json_array(f, _sonar_issues(counts["sonarcloud"], n_components, rnd))
+        f.write("}")
+
+    zap_dir = os.path.join(out_dir, "zap-report")
+    os.makedirs(zap_dir, exist_ok=True)
+    with open(os.path.join(zap_dir, "report_json.json"), "w") as f:
+        f.write('{"site": [{"@name": "http://localhost:8000", "alerts": ')
+        _write_json_array(f, _zap_alerts(counts["zap"], rnd))
+        f.write("}]}")
+
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 보안 리포트 생성")
+    parser.add_argument("total", type=int, help="전체 finding 수 (예: 1000 ~ 1000000)")
+    parser.add_argument("--out-dir", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    counts = generate(args.total, args.out_dir, args.seed)
+    print(f"[generate] {args.out_dir}: {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,9 @@
 # experiment/admin.py
 from django.contrib import admin
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .exports import iter_csv
 from .models import Person
 
 @admin.register(Person)
@@ -7,7 +11,19 @@ class PersonAdmin(admin.ModelAdmin):
     list_display = ('id','username', 'password_hash_short', 'role', 'email', 'full_name', 'phone', 'created_at')
     search_fields = ('username', 'full_name', 'email', 'phone')
     list_filter = ('role', 'gender')
+    actions = ('export_decrypted_csv',)
 
     def password_hash_short(self, obj):
         return (obj.password_hash[:12] + '...') if obj.password_hash else ''
-    password_hash_short.short_description = 'password_hash'
\ No newline at end of file
+    password_hash_short.short_description = 'password_hash'
+
+    # 복호화된 PII 가 나가므로 superuser 만
+    def has_export_permission(self, request):
+        return request.user.is_superuser
+
+    @admin.action(description='Export selected people as decrypted CSV', permissions=['export'])
+    def export_decrypted_csv(self, request, queryset):
+        filename = f"people-{timezone.now():%Y%m%dT%H%M%S}.csv"
+        response = StreamingHttpResponse(iter_csv(queryset), content_type='text/csv; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,73 @@
+# experiment/archive.py
+# 오래된 Person row 를 압축 + 암호화된 JSONL chunk 파일로 보관 (archive_people 커맨드에서 사용)
+#
+# chunk 파일 하나 = seal_bytes(gzip(JSONL))
+# 파일 이름은 chunk 첫 row 의 (created_at, id) 로 정해지므로, 기록 후 삭제 전에 중단되어도
+# 재실행 시 같은 row 부터 다시 읽어 같은 파일을 덮어쓴다 (중복 보관 없음).
+import os
+import gzip
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+
+from .crypto import seal_bytes, unseal_bytes
+from .models import Person
+
+ARCHIVE_SUFFIX = ".jsonl.gz.enc"
+
+
+def chunk_filename(first_row):
+    stamp = first_row["created_at"].strftime("%Y%m%dT%H%M%S%f")
+    return f"people-{stamp}-{first_row['id']}{ARCHIVE_SUFFIX}"
+
+
+def iter_chunks(cutoff, chunk_size):
+    """
+    created_at < cutoff 인 row 를 (created_at, id) keyset 순서로 chunk 단위 반환.
+    OFFSET 없이 마지막 key 다음부터 읽으므로 chunk 마다 인덱스 range scan 한 번.
+    """
+    qs = Person.objects.filter(created_at__lt=cutoff).order_by("created_at", "id").values()
+    rows = list(qs[:chunk_size])
+    while rows:
+        yield rows
+        last = rows[-1]
+        after_last = Q(created_at__gt=last["created_at"]) | Q(created_at=last["created_at"], id__gt=last["id"])
+        rows = list(qs.filter(after_last)[:chunk_size])
+
+
+def write_chunk(rows, archive_dir):
+    """rows → 압축/암호화 파일 (tmp 에 쓰고 fsync 후 rename). 반환: 파일 경로"""
+    payload = "".join(json.dumps(r, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n" for r in rows)
+    blob = seal_bytes(gzip.compress(payload.encode("utf-8"), compresslevel=6))
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, chunk_filename(rows[0]))
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return path
+
+
+def verify_chunk(path, rows):
+    """기록한 파일을 다시 읽어 row 수와 id 가 chunk 와 같은지 확인 (삭제 전에 호출)"""
+    archived = read_archive(path)
+    return [r["id"] for r in archived] == [r["id"] for r in rows]
+
+
+def delete_chunk(rows):
+    """짧은 트랜잭션 하나로 chunk 삭제 (SQLite write lock 을 오래 잡지 않음)"""
+    with transaction.atomic():
+        deleted, _ = Person.objects.filter(id__in=[r["id"] for r in rows]).delete()
+    return deleted
+
+
+def read_archive(path):
+    """보관 파일 → row dict 리스트 (복원/검증용)"""
+    with open(path, "rb") as f:
+        data = gzip.decompress(unseal_bytes(f.read()))
+    return [json.loads(line) for line in data.decode("utf-8").splitlines() if line]
@@ -0,0 +1,242 @@
+# experiment/batch_signup.py
+# 파트너 시스템용 일괄 가입 (POST /api/signups/batch, JSON 배열 또는 NDJSON)
+#
+#   1) 레코드마다 PersonForm 으로 검증, username 중복은 DB 를 한 번만 조회해서 미리 거름
+#   2) 비밀번호 해싱(PBKDF2) + PII 암호화는 CPU 작업이라 프로세스 풀에서 병렬 처리
+#   3) 준비된 레코드는 INSERT_CHUNK 개씩 bulk_create + SignupDailyStat 롤업을 한 트랜잭션으로
+#   4) 커밋된 chunk 는 DynamoDB 에 batch_writer 로 미러링
+#   5) 레코드별 결과를 처리되는 대로 NDJSON 한 줄씩 yield (마지막 줄은 summary)
+import json
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import transaction, IntegrityError
+
+from .dynamo import signups_table, person_item
+from .forms import PersonForm
+from .metrics import PHASE_LATENCY, DDB_ERRORS, BATCH_RECORDS
+from .models import Person, SignupDailyStat
+from .signup_workers import init_worker, prepare_secrets
+
+INSERT_CHUNK = 100
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class BatchError(ValueError):
+    """요청 본문 자체가 잘못된 경우 (view 에서 400 / 413 으로 변환)"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _executor():
+    """
+    프로세스 풀은 gunicorn 워커당 하나를 계속 재사용 (SIGNUP_HASH_WORKERS=0 이면 None → 현재 프로세스에서 처리).
+    풀 프로세스마다 Django 인터프리터가 하나씩 뜨므로 총 프로세스 수 = gunicorn 워커 수 × (1 + 이 값).
+    """
+    global _pool
+    workers = getattr(settings, "SIGNUP_HASH_WORKERS", 0)
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+
+            # fork 는 부모의 스레드 락 상태까지 복사하므로 spawn 으로 새 인터프리터를 띄운다
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker,
+            )
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# -------------------- 요청 본문 파싱 -------------------- #
+
+def parse_records(body, content_type):
+    """JSON 배열 / {"signups": [...]} / NDJSON → dict 목록"""
+    max_records = settings.SIGNUP_BATCH_MAX
+    try:
+        text = body.decode("utf-8")
+        if "ndjson" in content_type or "jsonlines" in content_type:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            records = json.loads(text)
+            if isinstance(records, dict):
+                records = records.get("signups")
+    except (UnicodeDecodeError, ValueError) as e:
+        raise BatchError(f"invalid JSON: {e}")
+    if not isinstance(records, list):
+        raise BatchError('expected a JSON array, {"signups": [...]} or NDJSON')
+    if not records:
+        raise BatchError("no signups in request")
+    if len(records) > max_records:
+        raise BatchError(f"too many signups: {len(records)} > {max_records}", status=413)
+    return records
+
+
+# -------------------- 처리 -------------------- #
+
+def unsaved_person(cleaned_data):
+    """검증된 폼 데이터 → 저장 전 Person (비밀번호/암호화는 호출하는 쪽에서)"""
+    return Person(
+        role=cleaned_data.get('role') or 'employee',
+        username=cleaned_data['username'],
+        email=cleaned_data.get('email'),
+        full_name=cleaned_data['full_name'],
+        dob=cleaned_data.get('dob'),
+        gender=cleaned_data.get('gender') or '',
+        country_code=cleaned_data.get('country_code'),
+        phone=cleaned_data['phone'],
+        address=cleaned_data.get('address') or '',
+    )
+
+
+def _result(index, status, username=None, **extra):
+    BATCH_RECORDS.inc(status=status)
+    row = {"index": index, "status": status}
+    if username is not None:
+        row["username"] = username
+    row.update(extra)
+    return row
+
+
+def _insert_chunk(people):
+    """
+    chunk 를 bulk_create + 롤업 갱신 (한 트랜잭션). 검사 이후 다른 요청이 같은 username 을
+    먼저 넣었으면 IntegrityError → 레코드별 savepoint 로 다시 넣어서 충돌난 것만 뺀다.
+    반환: (저장된 Person 목록, 충돌난 Person 목록)
+    """
+    with PHASE_LATENCY.time(phase="db_save"):
+        try:
+            with transaction.atomic():
+                Person.objects.bulk_create(people)
+                SignupDailyStat.add(people)
+            return people, []
+        except IntegrityError:
+            pass
+
+        saved, conflicts = [], []
+        with transaction.atomic():
+            for person in people:
+                try:
+                    with transaction.atomic():
+                        Person.objects.bulk_create([person])
+                    saved.append(person)
+                except IntegrityError:
+                    conflicts.append(person)
+            SignupDailyStat.add(saved)
+        return saved, conflicts
+
+
+def _mirror_to_dynamodb(people):
+    try:
+        with PHASE_LATENCY.time(phase="dynamodb_put"):
+            with signups_table().batch_writer() as batch:
+                for person in people:
+                    batch.put_item(Item=person_item(person))
+        return True
+    except Exception as e:
+        DDB_ERRORS.inc()
+        print("[DDB] batch_writer ERROR:", e)
+        return False
+
+
+def process(records):
+    """레코드별 결과 dict 를 처리되는 대로 yield, 마지막에 {"summary": {...}}"""
+    counts = {"created": 0, "invalid": 0, "conflict": 0, "error": 0}
+
+    # 1) 검증 + batch 안 중복
+    valid = []   # (index, cleaned_data)
+    seen = set()
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            counts["invalid"] += 1
+            yield _result(index, "invalid", errors={"__all__": ["expected a JSON object"]})
+            continue
+        form = PersonForm(record)
+        if not form.is_valid():
+            counts["invalid"] += 1
+            yield _result(index, "invalid", record.get("username"), errors=form.errors.get_json_data())
+            continue
+        username = form.cleaned_data["username"]
+        if username in seen:
+            counts["conflict"] += 1
+            yield _result(index, "conflict", username, errors={"username": ["duplicate in batch"]})
+            continue
+        seen.add(username)
+        valid.append((index, form.cleaned_data))
+
+    # 2) 이미 있는 username — 쿼리 한 번
+    existing = set()
+    usernames = [cd["username"] for _, cd in valid]
+    for start in range(0, len(usernames), 500):   # SQLite 변수 개수 제한
+        existing.update(
+            Person.objects.filter(username__in=usernames[start:start + 500]).values_list("username", flat=True)
+        )
+    pending = []
+    for index, cd in valid:
+        if cd["username"] in existing:
+            counts["conflict"] += 1
+            yield _result(index, "conflict", cd["username"], errors={"username": ["already exists"]})
+        else:
+            pending.append((index, cd))
+
+    # 3) 해싱/암호화 병렬 → chunk 단위 insert → DynamoDB → 결과
+    jobs = (
+        (cd["password"], {f: cd.get(f) or "" for f in Person.PII_FIELDS})
+        for _, cd in pending
+    )
+    pool = _executor()
+    prepared = pool.map(prepare_secrets, jobs, chunksize=8) if pool else map(prepare_secrets, jobs)
+
+    pos = 0
+    try:
+        while pos < len(pending):
+            chunk = pending[pos:pos + INSERT_CHUNK]
+            secrets = [next(prepared) for _ in chunk]   # 워커가 죽었으면 여기서 BrokenProcessPool
+            people = {}
+            for (index, cd), (password_hash, pii) in zip(chunk, secrets):
+                person = unsaved_person(cd)
+                person.password_hash = password_hash
+                for field, value in pii.items():
+                    setattr(person, field, value or getattr(person, field))
+                people[id(person)] = (index, person)
+
+            saved, conflicts = _insert_chunk([p for _, p in people.values()])
+            pos += len(chunk)
+            mirrored = _mirror_to_dynamodb(saved) if saved else True
+            for person in conflicts:
+                counts["conflict"] += 1
+                yield _result(people[id(person)][0], "conflict", person.username, errors={"username": ["already exists"]})
+            for person in saved:
+                counts["created"] += 1
+                yield _result(people[id(person)][0], "created", person.username, dynamodb=mirrored)
+    except BrokenProcessPool as e:
+        # 깨진 풀은 다시 쓸 수 없으므로 버리고 (다음 요청이 새로 만듦) 남은 레코드는 error 로 응답
+        print("[batch_signup] process pool broken:", e)
+        _discard_pool(pool)
+        for index, cd in pending[pos:]:
+            counts["error"] += 1
+            yield _result(index, "error", cd["username"], errors={"__all__": ["hashing worker failed, retry later"]})
+
+    yield {"summary": dict(counts, total=len(records))}
+
+
+def iter_ndjson(records):
+    for row in process(records):
+        yield json.dumps(row, ensure_ascii=False) + "\n"
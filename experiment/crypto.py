@@ -0,0 +1,167 @@
+# experiment/crypto.py
+# Person PII 필드용 버전 prefix 암호문 envelope
+#
+#   "a1:" + base64url(nonce 12B || ciphertext || GCM tag 16B)  (padding 제거)  ← AES-256-GCM (기본)
+#   "gAAAA..." (prefix 없음)                                                  ← 예전 Fernet 토큰, 복호화만 지원
+#
+# Fernet(AES-CBC + HMAC, base64) 대비 짧은 필드에서 길이가 절반 이하이고
+# 암호화/복호화 한 번에 AEAD 연산 하나만 든다.
+import os
+import base64
+import binascii
+from functools import lru_cache
+
+from django.conf import settings
+
+# cryptography (OpenSSL 바인딩) 는 첫 암호화/복호화 때 import — models 를 import 하는
+# manage.py 커맨드 / 마이그레이션 / 워커 부팅에서는 로딩 비용 없음
+
+AESGCM_PREFIX = "a1:"
+NONCE_SIZE = 12
+
+TAG_SIZE = 16
+_B64URL_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+# Fernet 토큰: version(0x80) || timestamp 8B || IV 16B || AES-CBC 블록(16B 배수, 최소 1개) || HMAC 32B
+# → base64 "gAAAA..." 로 시작, 최소 73 bytes
+_FERNET_SNIFF = "gAAAA"
+_FERNET_OVERHEAD = 1 + 8 + 16 + 32
+
+
+class DecryptionError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4)
+def _fernet_for(key):
+    from cryptography.fernet import Fernet
+    return Fernet(key.encode())
+
+
+@lru_cache(maxsize=4)
+def _aesgcm_for(key):
+    # FERNET_KEY 에서 HKDF 로 AES-GCM 전용 256bit 키 파생 (새 비밀 설정 불필요)
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    master = base64.urlsafe_b64decode(key.encode())
+    derived = HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=None, info=b"thesis-pii-aesgcm-v1",
+    ).derive(master)
+    return AESGCM(derived)
+
+
+def _key():
+    return settings.FERNET_KEY if settings.ENCRYPTION_ENABLED and settings.FERNET_KEY else None
+
+
+def _b64e(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64d(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _b64url_raw(text):
+    """base64url 문자만으로 된 문자열이면 디코딩한 bytes, 아니면 None"""
+    body = text.rstrip("=")
+    if not body or not _B64URL_CHARS.issuperset(body) or len(body) % 4 == 1:
+        return None
+    return _b64d(body)
+
+
+def is_aesgcm_envelope(val) -> bool:
+    """ "a1:" + base64url(nonce || ciphertext || tag) 형태인지 (평문 "a1: ..." 과 구분)"""
+    if not (isinstance(val, str) and val.startswith(AESGCM_PREFIX)):
+        return False
+    raw = _b64url_raw(val[len(AESGCM_PREFIX):])
+    return raw is not None and len(raw) >= NONCE_SIZE + TAG_SIZE
+
+
+def is_legacy_fernet(val) -> bool:
+    if not (isinstance(val, str) and val.startswith(_FERNET_SNIFF)):
+        return False
+    raw = _b64url_raw(val)
+    return (
+        raw is not None and raw[0] == 0x80
+        and len(raw) > _FERNET_OVERHEAD and (len(raw) - _FERNET_OVERHEAD) % 16 == 0
+    )
+
+
+def is_encrypted(val) -> bool:
+    return is_aesgcm_envelope(val) or is_legacy_fernet(val)
+
+
+def ciphertext_length(plaintext_bytes, cipher="aesgcm"):
+    """평문 n bytes 의 암호문 길이(문자 수) — PII 컬럼 max_length 산정용"""
+    if cipher == "fernet":
+        raw = _FERNET_OVERHEAD + (plaintext_bytes // 16 + 1) * 16
+        return -(-raw // 3) * 4                      # padding 포함
+    raw = NONCE_SIZE + plaintext_bytes + TAG_SIZE
+    return len(AESGCM_PREFIX) + -(-raw * 4 // 3)     # padding 제거
+
+
+def encrypt(val: str) -> str:
+    """
+    토글이 켜져 있으면 암호화 (PII_CIPHER: aesgcm | fernet).
+    값 모양으로 "이미 암호화됐는지" 추측하지 않는다 — 저장된 암호문을 다시 암호화하지 않는 건
+    호출하는 쪽 책임 (Person.save 는 DB 에서 읽은 값과 비교).
+    """
+    if not val:
+        return val
+    key = _key()
+    if not key:
+        return val
+    if getattr(settings, "PII_CIPHER", "aesgcm") == "fernet":
+        return _fernet_for(key).encrypt(val.encode()).decode()
+    nonce = os.urandom(NONCE_SIZE)
+    return AESGCM_PREFIX + _b64e(nonce + _aesgcm_for(key).encrypt(nonce, val.encode(), None))
+
+
+def decrypt(val: str) -> str:
+    """envelope 버전에 맞게 복호화. 평문이면 그대로 반환."""
+    if not is_encrypted(val):
+        return val
+    key = settings.FERNET_KEY
+    if not key:
+        raise DecryptionError("FERNET_KEY is not configured")
+
+    from cryptography.exceptions import InvalidTag
+    from cryptography.fernet import InvalidToken
+
+    try:
+        if is_aesgcm_envelope(val):
+            raw = _b64d(val[len(AESGCM_PREFIX):])
+            return _aesgcm_for(key).decrypt(raw[:NONCE_SIZE], raw[NONCE_SIZE:], None).decode()
+        return _fernet_for(key).decrypt(val.encode()).decode()
+    except (InvalidTag, InvalidToken, binascii.Error, ValueError) as e:
+        raise DecryptionError(f"cannot decrypt value: {e.__class__.__name__}") from e
+
+
+# -------------------- 바이트 단위 (archive 파일 등) -------------------- #
+
+ARCHIVE_MAGIC = b"TPA1"   # Thesis Person Archive v1: magic || nonce 12B || AES-GCM(ciphertext || tag)
+
+
+def seal_bytes(data: bytes) -> bytes:
+    """FERNET_KEY 파생 AES-GCM 키로 바이트열 암호화 (ENCRYPTION_ENABLED 와 무관하게 항상 암호화)"""
+    if not settings.FERNET_KEY:
+        raise DecryptionError("FERNET_KEY is not configured")
+    nonce = os.urandom(NONCE_SIZE)
+    return ARCHIVE_MAGIC + nonce + _aesgcm_for(settings.FERNET_KEY).encrypt(nonce, data, ARCHIVE_MAGIC)
+
+
+def unseal_bytes(blob: bytes) -> bytes:
+    if not settings.FERNET_KEY:
+        raise DecryptionError("FERNET_KEY is not configured")
+    if not blob.startswith(ARCHIVE_MAGIC):
+        raise DecryptionError("not a sealed archive blob")
+    from cryptography.exceptions import InvalidTag
+
+    body = blob[len(ARCHIVE_MAGIC):]
+    try:
+        return _aesgcm_for(settings.FERNET_KEY).decrypt(body[:NONCE_SIZE], body[NONCE_SIZE:], ARCHIVE_MAGIC)
+    except InvalidTag as e:
+        raise DecryptionError("archive authentication failed") from e
@@ -0,0 +1,216 @@
+# experiment/dynamo.py
+# thesis-signups DynamoDB 테이블 접근 (쓰기 item 구성 + 샤드 scatter-gather 조회)
+#
+# 쓰기 샤딩: role 이 2개(employee/guest)뿐이라 role 을 그대로 PK 로 쓰면 가입이 몰릴 때
+# 쓰기가 파티션 1~2개에 집중돼 throttle 된다. 그래서 PK 를 "role#NN" 으로 나눈다
+# (NN = crc32(username) % DDB_WRITE_SHARDS — 프로세스와 무관하게 항상 같은 값).
+# 시간 범위 GSI 도 같은 이유로 "YYYY-MM-DD#NN" bucket 을 파티션 키로 쓴다.
+# 읽을 때는 샤드 N 개를 스레드로 동시에 Query 하고 정렬 키 순서로 병합한다.
+#
+# DDB_WRITE_SHARDS 는 테이블 수명 동안 고정 — 바꾸면 기존 item 을 찾을 수 없으므로
+# 새 테이블로 migrate_signups_shards 를 다시 돌려야 한다.
+# DDB_ENDPOINT_URL 을 설정하면 DynamoDB Local 같은 로컬 대체 서버로 붙는다.
+#
+# boto3/botocore import 는 ~150ms 라서 실제로 DynamoDB 를 쓸 때 처음 import 한다
+# (워커 부팅, manage.py check / migrate 에서는 로딩하지 않음).
+import heapq
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from operator import itemgetter
+
+from django.conf import settings
+
+# infra/terraform/main.tf 의 global_secondary_index 와 동일해야 함
+CREATED_INDEX = "created_shard-created_at-index"
+
+# boto3 resource 는 스레드 간 공유하면 안 되므로 스레드별로 테이블 이름당 하나씩 재사용
+_local = threading.local()
+
+# scatter-gather 용 스레드 풀 — 오래 사는 스레드라야 위 thread-local resource 가 재사용된다
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def signups_table(name=None):
+    name = name or settings.DDB_TABLE_SIGNUPS
+    tables = getattr(_local, "tables", None)
+    if tables is None:
+        tables = _local.tables = {}
+    table = tables.get(name)
+    if table is None:
+        import boto3
+
+        kwargs = {"region_name": settings.AWS_REGION}
+        endpoint = getattr(settings, "DDB_ENDPOINT_URL", "")
+        if endpoint:
+            kwargs["endpoint_url"] = endpoint
+        table = tables[name] = boto3.resource("dynamodb", **kwargs).Table(name)
+    return table
+
+
+# -------------------- 샤드 키 -------------------- #
+
+def shard_count():
+    return max(1, int(getattr(settings, "DDB_WRITE_SHARDS", 1)))
+
+
+def shard_for(username, shards=None):
+    return zlib.crc32(str(username).encode()) % (shards or shard_count())
+
+
+def _suffix(shard):
+    return f"{shard:02d}"
+
+
+def partition_key(role, username, shards=None):
+    """테이블 PK: role#NN"""
+    return f"{role}#{_suffix(shard_for(username, shards))}"
+
+
+def to_ddb_timestamp(value):
+    """UTC, 마이크로초 고정 ISO 문자열 → 문자열 정렬 = 시간 정렬"""
+    if not isinstance(value, datetime):
+        return str(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return value.astimezone(dt_timezone.utc).isoformat(timespec="microseconds")
+
+
+def day_bucket(value):
+    """GSI 파티션 키: UTC 날짜 (YYYY-MM-DD)"""
+    return to_ddb_timestamp(value)[:10]
+
+
+def person_item(person, shards=None):
+    created_at = getattr(person, "created_at", None)
+    shard = _suffix(shard_for(person.username, shards))
+    day = day_bucket(created_at)
+    return {
+        "pk": f"{person.role}#{shard}",          # PK (쓰기 샤드)
+        "username": person.username,             # SK
+        "role": person.role,
+        "email": person.email or "",
+        "phone": person.phone or "",
+        "address": person.address or "",
+        "created_at": to_ddb_timestamp(created_at),
+        "created_day": day,
+        "created_shard": f"{day}#{shard}",       # GSI PK (날짜 bucket 도 샤드로 분산)
+        "mode_encrypted": bool(getattr(settings, "ENCRYPTION_ENABLED", False)),
+    }
+
+
+def reshard_item(item, shards=None):
+    """예전 테이블(PK=role) item → 샤드 테이블 item (migrate_signups_shards 용)"""
+    new = dict(item)
+    shard = _suffix(shard_for(item["username"], shards))
+    new["pk"] = f"{item['role']}#{shard}"
+    if item.get("created_at"):
+        # 예전 item 은 형식이 제각각일 수 있으므로 (마이크로초 없음, 공백 구분 등) GSI 정렬용 고정 형식으로
+        created_at = item["created_at"]
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                pass
+        new["created_at"] = to_ddb_timestamp(created_at)
+        new["created_day"] = day_bucket(created_at)
+        new["created_shard"] = f"{new['created_day']}#{shard}"
+    return new
+
+
+def _days(start, end):
+    day = datetime.fromisoformat(day_bucket(start)).date()
+    last = datetime.fromisoformat(day_bucket(end)).date()
+    while day <= last:
+        yield day.isoformat()
+        day += timedelta(days=1)
+
+
+def _query_page(table, kwargs):
+    return (table or signups_table()).query(**kwargs)
+
+
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=min(shard_count(), 16), thread_name_prefix="ddb-shard")
+        return _pool
+
+
+def _shard_items(table, kwargs, page_size=None):
+    """
+    파티션 하나의 item 을 정렬 키 순서로 yield. 첫 페이지 요청은 호출 즉시 스레드 풀에 보내고,
+    페이지를 받을 때마다 다음 페이지를 미리 요청한다 → 샤드당 메모리는 최대 2 페이지.
+    table 을 넘기지 않으면 풀 스레드가 각자 자기 boto3 resource 를 쓴다.
+    """
+    kwargs = dict(kwargs)
+    if page_size:
+        kwargs["Limit"] = page_size
+    pool = _executor()
+    first = pool.submit(_query_page, table, kwargs)
+
+    def items():
+        future = first
+        while future is not None:
+            resp = future.result()
+            last_key = resp.get("LastEvaluatedKey")
+            future = pool.submit(_query_page, table, dict(kwargs, ExclusiveStartKey=last_key)) if last_key else None
+            yield from resp.get("Items", [])
+
+    return items()
+
+
+def _scatter_gather(table, queries, sort_key, page_size=None):
+    """샤드별 Query 를 동시에 시작하고, 페이지 단위로 흘러오는 결과를 정렬 키 기준으로 병합 (lazy)"""
+    streams = [_shard_items(table, kw, page_size) for kw in queries]
+    if len(streams) == 1:
+        return streams[0]
+    return heapq.merge(*streams, key=itemgetter(sort_key))
+
+
+def iter_role(role, table=None, page_size=None):
+    """role 의 모든 샤드를 동시에 읽어서 username 순으로 yield"""
+    from boto3.dynamodb.conditions import Key
+
+    queries = [
+        {"KeyConditionExpression": Key("pk").eq(f"{role}#{_suffix(shard)}")}
+        for shard in range(shard_count())
+    ]
+    yield from _scatter_gather(table, queries, "username", page_size)
+
+
+def get_signup(role, username, table=None):
+    """(role, username) 단건 조회 — 샤드는 username 으로 계산되므로 GetItem 한 번"""
+    table = table or signups_table()
+    resp = table.get_item(Key={"pk": partition_key(role, username), "username": username})
+    return resp.get("Item")
+
+
+def iter_signups_between(start, end, table=None, page_size=None):
+    """
+    start <= created_at <= end 인 signup item 을 시간순으로 yield.
+    날짜 bucket 마다 샤드 N 개를 동시에 Query 해서 병합 → 메모리는 샤드당 최대 2 페이지.
+    """
+    from boto3.dynamodb.conditions import Key
+
+    lo, hi = to_ddb_timestamp(start), to_ddb_timestamp(end)
+    for day in _days(start, end):
+        queries = [
+            {
+                "IndexName": CREATED_INDEX,
+                "KeyConditionExpression": (
+                    Key("created_shard").eq(f"{day}#{_suffix(shard)}") & Key("created_at").between(lo, hi)
+                ),
+            }
+            for shard in range(shard_count())
+        ]
+        yield from _scatter_gather(table, queries, "created_at", page_size)
+
+
+def recent_signups(hours=1, table=None, now=None):
+    """최근 N 시간 가입자 목록"""
+    now = now or datetime.now(dt_timezone.utc)
+    return list(iter_signups_between(now - timedelta(hours=hours), now, table=table))
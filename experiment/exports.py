@@ -0,0 +1,71 @@
+# experiment/exports.py
+# Person 테이블을 복호화된 CSV 로 스트리밍 (admin action / export_people 커맨드 공용)
+#
+# DB 는 iterator(chunk_size) 로 chunk 단위로만 읽고, chunk 복호화는 스레드 풀에 맡긴다.
+# 동시에 떠 있는 chunk 는 최대 lookahead 개 → export 크기와 무관하게 메모리 일정.
+import csv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from .crypto import decrypt, DecryptionError
+from .models import Person
+
+EXPORT_COLUMNS = (
+    'id', 'role', 'username', 'email', 'full_name', 'dob', 'gender',
+    'country_code', 'phone', 'agree_sms', 'address', 'created_at',
+)
+_PII_INDEXES = tuple(EXPORT_COLUMNS.index(f) for f in Person.PII_FIELDS)
+
+DECRYPT_ERROR = '[decrypt error]'
+
+# 스프레드시트가 수식으로 해석하는 첫 글자 (CSV formula injection) → 앞에 ' 를 붙여 문자열로
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _neutralize(value):
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _Echo:
+    """csv.writer 가 쓰는 값을 그대로 돌려주는 pseudo-buffer"""
+
+    def write(self, value):
+        return value
+
+
+def _decrypt_chunk(rows):
+    writer = csv.writer(_Echo())
+    out = []
+    for row in rows:
+        row = list(row)
+        for i in _PII_INDEXES:
+            try:
+                row[i] = decrypt(row[i] or '')
+            except DecryptionError:
+                row[i] = DECRYPT_ERROR
+        out.append(writer.writerow([_neutralize(v) for v in row]))
+    return ''.join(out)
+
+
+def iter_csv(queryset=None, chunk_size=2000, workers=4, lookahead=4):
+    """헤더 → chunk 별 CSV 문자열을 순서대로 yield"""
+    if queryset is None:
+        queryset = Person.objects.all()
+    rows = queryset.order_by('pk').values_list(*EXPORT_COLUMNS).iterator(chunk_size=chunk_size)
+
+    yield csv.writer(_Echo()).writerow(EXPORT_COLUMNS)   # 첫 바이트는 DB 조회 전에 바로
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export-decrypt') as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            pending.append(pool.submit(_decrypt_chunk, chunk))
+            if len(pending) >= lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,74 @@
+# experiment/management/commands/archive_people.py
+import re
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from experiment.archive import iter_chunks, write_chunk, verify_chunk, delete_chunk
+
+_AGE_RE = re.compile(r"^(\d+)\s*([dh]?)$")
+
+
+def parse_older_than(value):
+    """'90d' / '90' (일) / '12h' / '2025-01-01' → cutoff datetime"""
+    m = _AGE_RE.match(value.strip())
+    if m:
+        amount, unit = int(m.group(1)), m.group(2) or "d"
+        delta = timedelta(hours=amount) if unit == "h" else timedelta(days=amount)
+        return timezone.now() - delta
+    try:
+        cutoff = datetime.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"--older-than 형식 오류: {value!r} (예: 90d, 12h, 2025-01-01)")
+    if timezone.is_naive(cutoff):
+        cutoff = timezone.make_aware(cutoff)
+    return cutoff
+
+
+class Command(BaseCommand):
+    help = "오래된 Person row 를 압축/암호화 JSONL 로 보관한 뒤 chunk 단위로 삭제 (중단 후 재실행 가능)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", required=True, help="예: 90d, 12h, 2025-01-01")
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--sleep", type=float, default=0.2,
+                            help="chunk 사이 대기(초) — 운영 트래픽과 함께 돌릴 때 throttle")
+        parser.add_argument("--max-chunks", type=int, default=0, help="이번 실행에서 처리할 최대 chunk 수 (0 = 전부)")
+        parser.add_argument("--archive-dir", default=str(settings.BASE_DIR / "archives" / "people"))
+        parser.add_argument("--dry-run", action="store_true", help="보관/삭제 없이 대상 개수만 출력")
+
+    def handle(self, *args, **opts):
+        if not settings.FERNET_KEY:
+            raise CommandError("FERNET_KEY 가 필요합니다 (archive 파일 암호화)")
+        if opts["chunk_size"] <= 0:
+            raise CommandError("--chunk-size 는 1 이상")
+
+        cutoff = parse_older_than(opts["older_than"])
+        self.stdout.write(f"[archive_people] cutoff={cutoff.isoformat()} chunk={opts['chunk_size']}")
+
+        chunks = rows_total = 0
+        for rows in iter_chunks(cutoff, opts["chunk_size"]):
+            if opts["dry_run"]:
+                rows_total += len(rows)
+                chunks += 1
+            else:
+                path = write_chunk(rows, opts["archive_dir"])
+                # 보관 파일을 다시 열어 확인된 경우에만 삭제 (파일이 깨졌으면 DB row 는 그대로 둔다)
+                if not verify_chunk(path, rows):
+                    raise CommandError(f"보관 파일 검증 실패, 삭제하지 않음: {path}")
+                deleted = delete_chunk(rows)
+                rows_total += deleted
+                chunks += 1
+                self.stdout.write(f"  chunk {chunks}: {deleted} rows → {path}")
+
+            if opts["max_chunks"] and chunks >= opts["max_chunks"]:
+                self.stdout.write("  --max-chunks 도달, 중단 (다시 실행하면 이어서 처리)")
+                break
+            if opts["sleep"] > 0 and not opts["dry_run"]:
+                time.sleep(opts["sleep"])
+
+        verb = "would archive" if opts["dry_run"] else "archived"
+        self.stdout.write(self.style.SUCCESS(f"[archive_people] {verb} {rows_total} rows in {chunks} chunk(s)"))
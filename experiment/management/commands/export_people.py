@@ -0,0 +1,26 @@
+# experiment/management/commands/export_people.py
+from django.core.management.base import BaseCommand
+
+from experiment.exports import iter_csv
+
+
+class Command(BaseCommand):
+    help = "Person 테이블을 복호화된 CSV 로 스트리밍 출력 (메모리 사용량 일정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", "-o", default="-", help="출력 파일 (기본: stdout)")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--workers", type=int, default=4, help="복호화 스레드 수")
+        parser.add_argument("--lookahead", type=int, default=4, help="동시에 복호화 중인 최대 chunk 수")
+
+    def handle(self, *args, **opts):
+        chunks = iter_csv(chunk_size=opts["chunk_size"], workers=opts["workers"], lookahead=opts["lookahead"])
+        if opts["output"] == "-":
+            for text in chunks:
+                self.stdout.write(text, ending="")
+            self.stdout.flush()
+            return
+        with open(opts["output"], "w", newline="", encoding="utf-8") as f:
+            for text in chunks:
+                f.write(text)
+        self.stderr.write(self.style.SUCCESS(f"[export_people] 저장 완료: {opts['output']}"))
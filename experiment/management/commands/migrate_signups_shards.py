@@ -0,0 +1,63 @@
+# experiment/management/commands/migrate_signups_shards.py
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from experiment.dynamo import reshard_item, shard_count, signups_table
+
+
+class Command(BaseCommand):
+    help = "예전 thesis-signups(PK=role) item 을 샤드 테이블(PK=role#NN) 로 복사 (여러 번 돌려도 같은 결과)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", default=settings.DDB_TABLE_SIGNUPS_LEGACY)
+        parser.add_argument("--target", default=settings.DDB_TABLE_SIGNUPS)
+        parser.add_argument("--segments", type=int, default=4, help="병렬 Scan segment 수")
+        parser.add_argument("--page-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true", help="쓰지 않고 옮길 item 수만 출력")
+
+    def handle(self, *args, **opts):
+        if opts["source"] == opts["target"]:
+            raise CommandError("--source 와 --target 이 같습니다")
+        if opts["segments"] <= 0:
+            raise CommandError("--segments 는 1 이상")
+
+        self.stdout.write(
+            f"[migrate_signups_shards] {opts['source']} → {opts['target']} "
+            f"(shards={shard_count()}, segments={opts['segments']})"
+        )
+        with ThreadPoolExecutor(max_workers=opts["segments"]) as pool:
+            counts = list(pool.map(lambda seg: self._copy_segment(seg, opts), range(opts["segments"])))
+
+        verb = "대상" if opts["dry_run"] else "복사 완료"
+        self.stdout.write(self.style.SUCCESS(f"[migrate_signups_shards] {sum(counts)} item {verb}"))
+
+    def _copy_segment(self, segment, opts):
+        # 스레드마다 자기 boto3 resource (signups_table 은 thread-local)
+        source = signups_table(opts["source"])
+        kwargs = {"Segment": segment, "TotalSegments": opts["segments"], "Limit": opts["page_size"]}
+        copied = 0
+        if opts["dry_run"]:
+            for page in self._scan_pages(source, kwargs):
+                copied += len(page)
+            return copied
+
+        # batch_writer: 25개씩 BatchWriteItem + UnprocessedItems 자동 재시도
+        with signups_table(opts["target"]).batch_writer(overwrite_by_pkeys=["pk", "username"]) as batch:
+            for page in self._scan_pages(source, kwargs):
+                for item in page:
+                    batch.put_item(Item=reshard_item(item))
+                copied += len(page)
+        return copied
+
+    @staticmethod
+    def _scan_pages(table, kwargs):
+        kwargs = dict(kwargs)
+        while True:
+            resp = table.scan(**kwargs)
+            yield resp.get("Items", [])
+            last_key = resp.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            kwargs["ExclusiveStartKey"] = last_key
@@ -0,0 +1,24 @@
+# experiment/management/commands/rebuild_signup_stats.py
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from experiment import stats
+
+
+class Command(BaseCommand):
+    help = ("Person 테이블로 SignupDailyStat 롤업을 다시 계산 (초기 적재 / 불일치 복구용). "
+            "archive_people 로 지운 기간의 기록은 유지")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="이 날짜(YYYY-MM-DD)부터 다시 계산 (기본: 남아 있는 가장 오래된 Person 의 날짜)")
+
+    def handle(self, *args, **opts):
+        since = None
+        if opts["since"]:
+            try:
+                since = date.fromisoformat(opts["since"])
+            except ValueError:
+                raise CommandError(f"--since 형식 오류: {opts['since']!r} (예: 2025-01-01)")
+        buckets = stats.rebuild(since)
+        self.stdout.write(self.style.SUCCESS(f"[rebuild_signup_stats] {buckets} bucket(s) 재작성 완료"))
@@ -0,0 +1,72 @@
+# experiment/management/commands/reencrypt_pii.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from experiment.crypto import DecryptionError, encrypt, decrypt, is_encrypted, is_legacy_fernet
+from experiment.models import Person
+
+
+class Command(BaseCommand):
+    help = "Person PII 필드를 현재 암호문 형식(PII_CIPHER)으로 재암호화 (예: Fernet → AES-GCM)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--include-plaintext", action="store_true",
+                            help="평문으로 남아 있는 값도 암호화")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def _needs_update(self, value, include_plaintext):
+        if not value:
+            return False
+        if is_legacy_fernet(value):
+            return True
+        return include_plaintext and not is_encrypted(value)
+
+    def handle(self, *args, **opts):
+        # 암호화가 꺼져 있으면 encrypt() 가 평문을 돌려주므로 복호화만 되어버림
+        if not (settings.ENCRYPTION_ENABLED and settings.FERNET_KEY):
+            raise CommandError("ENCRYPTION_ENABLED / FERNET_KEY 설정이 필요합니다")
+
+        batch_size = opts["batch_size"]
+        fields = list(Person.PII_FIELDS)
+        scanned = updated = skipped = 0
+        last_pk = 0
+
+        # pk 기준 keyset 으로 배치 단위 처리 (전체 queryset 을 메모리에 올리지 않음)
+        while True:
+            batch = list(
+                Person.objects.filter(pk__gt=last_pk).order_by("pk").only("pk", *fields)[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            scanned += len(batch)
+
+            changed = []
+            for person in batch:
+                dirty = False
+                for field in fields:
+                    value = getattr(person, field)
+                    if not self._needs_update(value, opts["include_plaintext"]):
+                        continue
+                    # 다른 키로 암호화됐거나 깨진 값 하나 때문에 전체 실행이 멈추지 않도록 건너뛰고 보고
+                    try:
+                        plaintext = decrypt(value)
+                    except DecryptionError as e:
+                        skipped += 1
+                        self.stderr.write(f"  skip pk={person.pk} field={field}: {e}")
+                        continue
+                    setattr(person, field, encrypt(plaintext))
+                    dirty = True
+                if dirty:
+                    changed.append(person)
+
+            if changed and not opts["dry_run"]:
+                with transaction.atomic():
+                    Person.objects.bulk_update(changed, fields)
+            updated += len(changed)
+
+        verb = "would update" if opts["dry_run"] else "updated"
+        summary = f"[reencrypt_pii] scanned={scanned} {verb}={updated} skipped={skipped} (cipher: {settings.PII_CIPHER})"
+        self.stdout.write(self.style.WARNING(summary) if skipped else self.style.SUCCESS(summary))
@@ -0,0 +1,334 @@
+# experiment/metrics.py
+# 프로세스 내 counter / histogram 레지스트리 + Prometheus text format 출력
+#
+# gunicorn 워커마다 값이 따로 쌓이므로, 각 프로세스가 METRICS_DIR 에
+# 자기 스냅샷 파일을 주기적으로(METRICS_FLUSH_INTERVAL 초) 덮어쓰고,
+# /metrics 요청 시 디렉터리의 모든 파일을 합산해서 보여준다.
+# 아무것도 기록하지 않은 프로세스(manage.py 커맨드, 테스트, 풀 워커 등)는 파일을 쓰지 않고,
+# 이미 종료된 프로세스의 파일은 scrape 때 metrics-archive.json 하나로 합쳐서 지운다
+# (counter / histogram 은 누적값이므로 합쳐도 값이 보존됨).
+import os
+import json
+import time
+import uuid
+import atexit
+import bisect
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:   # Windows 개발 환경: 파일 잠금 없이 동작
+    fcntl = None
+
+from django.conf import settings
+
+# 초 단위 latency 버킷 (PBKDF2 해싱이 수백 ms 걸리므로 위쪽을 넉넉히)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _label_key(labelnames, labels):
+    if set(labels) != set(labelnames):
+        raise ValueError(f"expected labels {labelnames}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(pairs):
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _format_value(v):
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+ARCHIVE_FILE = "metrics-archive.json"
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _file_pid(fname):
+    """metrics-<pid>-<token>.json → pid (archive 등은 None)"""
+    try:
+        return int(fname[len("metrics-"):].split("-", 1)[0])
+    except ValueError:
+        return None
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        self.registry.maybe_flush()
+
+    def snapshot(self):
+        return [[list(k), v] for k, v in self.values.items()]
+
+    @staticmethod
+    def merge(into, series):
+        for key, v in series:
+            key = tuple(key)
+            into[key] = into.get(key, 0) + v
+
+    def render(self, merged):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for key in sorted(merged):
+            lines.append(f"{self.name}{_format_labels(zip(self.labelnames, key))} {_format_value(merged[key])}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels → [bucket 별 개수(비누적)..., +Inf 개수, sum]
+        self.values = {}
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self.registry.lock:
+            row = self.values.get(key)
+            if row is None:
+                row = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[idx] += 1
+            row[-1] += value
+        self.registry.maybe_flush()
+
+    def time(self, **labels):
+        """with HISTOGRAM.time(phase="encrypt"): ..."""
+        return _Timer(self, labels)
+
+    def snapshot(self):
+        return [[list(k), list(row)] for k, row in self.values.items()]
+
+    @staticmethod
+    def merge(into, series):
+        for key, row in series:
+            key = tuple(key)
+            cur = into.get(key)
+            if cur is None:
+                into[key] = list(row)
+            else:
+                for i, v in enumerate(row):
+                    cur[i] += v
+
+    def render(self, merged):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key in sorted(merged):
+            row = merged[key]
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for le, n in zip(bounds, row[:-1]):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', le)])} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(row[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {_format_value(cumulative)}")
+        return lines
+
+
+class Registry:
+    def __init__(self, install_hooks=True):
+        """install_hooks=False: atexit flush / fork 훅 없이 (테스트 등 프로세스 전역 REGISTRY 가 아닌 경우)"""
+        self.lock = threading.Lock()
+        self.metrics = {}
+        self._new_instance()
+        self._last_flush = 0.0
+        if not install_hooks:
+            return
+        atexit.register(self.flush)
+        # gunicorn --preload: master 에서 import 된 뒤 fork 되므로 워커마다 새 id / 빈 값으로 시작
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _new_instance(self):
+        # pid 재사용 시 이전 프로세스 파일을 덮어쓰지 않도록 임의 토큰 포함
+        self.instance_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def _after_fork(self):
+        self.lock = threading.Lock()
+        self._new_instance()
+        for metric in self.metrics.values():
+            metric.values = {}
+
+    def _register(self, cls, name, *args, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(self, name, *args, **kwargs)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    # ---------- 파일 기반 프로세스 간 집계 ---------- #
+
+    @staticmethod
+    def _dir():
+        return getattr(settings, "METRICS_DIR", "")
+
+    def maybe_flush(self):
+        interval = getattr(settings, "METRICS_FLUSH_INTERVAL", 5.0)
+        if time.monotonic() - self._last_flush >= interval:
+            self.flush()
+
+    def flush(self):
+        directory = self._dir()
+        self._last_flush = time.monotonic()
+        if not directory:
+            return
+        with self.lock:
+            if not any(m.values for m in self.metrics.values()):
+                return   # 기록한 값이 없으면 파일도 만들지 않음
+            data = {name: m.snapshot() for name, m in self.metrics.items()}
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"metrics-{self.instance_id}.json")
+            tmp = path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)   # 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록
+        except OSError as e:
+            print("[metrics] flush ERROR:", e)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _merge_sources(self, sources):
+        merged = {name: {} for name in self.metrics}
+        for data in sources:
+            for name, series in data.items():
+                metric = self.metrics.get(name)
+                if metric is not None:
+                    metric.merge(merged[name], series)
+        return merged
+
+    @staticmethod
+    @contextmanager
+    def _locked(directory):
+        """같은 디렉터리를 scrape 하는 워커끼리 compact / 읽기가 겹치지 않도록 (archive 로 옮기는 중인 값 중복 집계 방지)"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(directory, ".compact.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _compact(self, directory):
+        """종료된 프로세스의 스냅샷 파일을 archive 파일 하나로 합치고 삭제 (_locked 안에서 호출)"""
+        dead = [
+            fname for fname in os.listdir(directory)
+            if fname.startswith("metrics-") and fname.endswith(".json")
+            and _file_pid(fname) not in (None, os.getpid()) and not _pid_alive(_file_pid(fname))
+        ]
+        if not dead:
+            return
+        archive_path = os.path.join(directory, ARCHIVE_FILE)
+        sources = [self._read(archive_path) or {}]
+        sources += [d for d in (self._read(os.path.join(directory, f)) for f in dead) if d]
+        merged = self._merge_sources(sources)
+        data = {name: [[list(k), v] for k, v in values.items()] for name, values in merged.items()}
+        try:
+            tmp = archive_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, archive_path)
+            for fname in dead:
+                os.remove(os.path.join(directory, fname))
+        except OSError as e:
+            print("[metrics] compact ERROR:", e)
+
+    def _collect(self):
+        """모든 프로세스 스냅샷 합산 → {metric name: merged values}"""
+        self.flush()
+        directory = self._dir()
+        if directory and os.path.isdir(directory):
+            sources = []
+            with self._locked(directory):
+                self._compact(directory)
+                for fname in os.listdir(directory):
+                    if fname.startswith("metrics-") and fname.endswith(".json"):
+                        data = self._read(os.path.join(directory, fname))
+                        if data is not None:
+                            sources.append(data)
+        else:
+            with self.lock:
+                sources = [{name: m.snapshot() for name, m in self.metrics.items()}]
+        return self._merge_sources(sources)
+
+    def render(self):
+        merged = self._collect()
+        lines = []
+        for name in sorted(self.metrics):
+            lines.extend(self.metrics[name].render(merged[name]))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# -------------------- signup 지표 -------------------- #
+
+REQUESTS = REGISTRY.counter(
+    "signup_requests_total", "Signup page requests by method and status code.", ("method", "status"))
+REQUEST_LATENCY = REGISTRY.histogram(
+    "signup_request_duration_seconds", "Signup view latency.", ("method",))
+FORM_ERRORS = REGISTRY.counter(
+    "signup_form_errors_total", "Signup POSTs rejected by form validation.")
+# phase: password_hash | encrypt | db_save | dynamodb_put
+PHASE_LATENCY = REGISTRY.histogram(
+    "signup_phase_duration_seconds", "Latency of individual signup phases.", ("phase",))
+DDB_ERRORS = REGISTRY.counter(
+    "signup_dynamodb_errors_total", "Failed DynamoDB put_item calls.")
+BATCH_RECORDS = REGISTRY.counter(
+    "signup_batch_records_total", "Batch signup API records by outcome.", ("status",))
@@ -1,4 +1,11 @@
 # For handling ZAP's High severity (CSP Header Not Set (HIGH))
+import random
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+import profile_hooks
+
 
 class CSPMiddleware:
     def __init__(self, get_response):
@@ -17,3 +24,36 @@ class CSPMiddleware:
         #    "img-src 'self' data:; "
         #)
         return response
+
+
+# 요청 단위 프로파일링 (cProfile / tracemalloc) → metrics_output/profiles/
+class ProfilingMiddleware:
+    """
+    - PROFILING_SAMPLE_RATE (0~1) 비율만큼 요청을 PROFILING_MODE 로 프로파일
+    - PROFILING_HEADER_ENABLED 일 때는 'X-Profile: cprofile|tracemalloc' 헤더가 붙은 요청도 프로파일
+    둘 다 해당 없으면 미들웨어 체인에서 빠짐 (오버헤드 없음)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = float(getattr(settings, "PROFILING_SAMPLE_RATE", 0) or 0)
+        self.mode = getattr(settings, "PROFILING_MODE", "cprofile")
+        self.header_enabled = bool(getattr(settings, "PROFILING_HEADER_ENABLED", False))
+        if self.sample_rate <= 0 and not self.header_enabled:
+            raise MiddlewareNotUsed
+
+    def _mode_for(self, request):
+        if self.header_enabled:
+            requested = request.META.get("HTTP_X_PROFILE", "").lower()
+            if requested:
+                return requested if requested in profile_hooks.MODES else "cprofile"
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return self.mode
+        return ""
+
+    def __call__(self, request):
+        mode = self._mode_for(request)
+        if not mode:
+            return self.get_response(request)
+        with profile_hooks.profiled(f"request-{request.method}-{request.path}", mode):
+            return self.get_response(request)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.25 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['created_at', 'id'], name='person_created_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.25 on 2026-10-19 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiment', '0002_person_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SignupDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('role', models.CharField(max_length=20)),
+                ('gender', models.CharField(blank=True, max_length=10)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='signupdailystat',
+            constraint=models.UniqueConstraint(fields=('day', 'role', 'gender'), name='signup_stat_unique_bucket'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.25 on 2026-10-19 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiment', '0003_signup_daily_stat'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='address',
+            field=models.CharField(blank=True, max_length=1444),
+        ),
+        migrations.AlterField(
+            model_name='person',
+            name='email',
+            field=models.EmailField(blank=True, max_length=1444, null=True),
+        ),
+        migrations.AlterField(
+            model_name='person',
+            name='full_name',
+            field=models.CharField(max_length=740),
+        ),
+        migrations.AlterField(
+            model_name='person',
+            name='phone',
+            field=models.CharField(max_length=356),
+        ),
+    ]
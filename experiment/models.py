@@ -1,72 +1,91 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction, IntegrityError
+from django.db.models import F
 from django.utils import timezone
 from django.contrib.auth.hashers import make_password, check_password
 
-# ⬇️ 추가: 토글/키 읽어서 Fernet 사용
-from django.conf import settings
-from cryptography.fernet import Fernet, InvalidToken
-
-
-def _fernet():
-    if settings.ENCRYPTION_ENABLED and settings.FERNET_KEY:
-        return Fernet(settings.FERNET_KEY.encode())
-    return None
+# ⬇️ PII 암호화: 버전 prefix envelope (AES-GCM, 예전 Fernet 값도 복호화) → experiment/crypto.py
+from .crypto import is_encrypted as _is_encrypted, encrypt as _enc, decrypt as _dec, ciphertext_length
+from .metrics import PHASE_LATENCY
 
-def _is_encrypted(val: str) -> bool:
-    return isinstance(val, str) and val.startswith("gAAAA")  # Fernet 토큰의 전형적 prefix
 
-def _enc(val: str) -> str:
-    """토글이 켜져있고 아직 암호화되지 않은 값만 암호화"""
-    if not val:
-        return val
-    f = _fernet()
-    if not f or _is_encrypted(val):
-        return val
-    return f.encrypt(val.encode()).decode()
+def _pii_length(max_chars):
+    """평문 max_chars 글자(UTF-8 최대 4 bytes/글자)의 암호문이 들어가는 컬럼 길이 (AES-GCM / Fernet 중 큰 쪽)"""
+    return max(ciphertext_length(max_chars * 4, cipher) for cipher in ("aesgcm", "fernet"))
 
 
 class Person(models.Model):
     ROLE_CHOICES = (('employee','Employee'), ('guest','Guest'))
     GENDER_CHOICES = (('male','Male'), ('female','Female'), ('other','Other'))
+    # 암호화 대상 필드 (save / 재암호화 / export 에서 공통 사용)
+    PII_FIELDS = ('email', 'full_name', 'phone', 'address')
 
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='employee')
     username = models.CharField(max_length=80, unique=True)
     password_hash = models.CharField(max_length=128)   # store hashed password
 
+    # PII 컬럼 길이는 평문(폼 max_length)이 아니라 그 암호문 기준 → _pii_length
     # ⚠️ EmailField라 해도 DB 제약은 없음 → 암호문 저장 가능(형식검사는 폼에서만)
-    email = models.EmailField(blank=True, null=True)
+    email = models.EmailField(max_length=_pii_length(254), blank=True, null=True)
 
-    full_name = models.CharField(max_length=120)
+    full_name = models.CharField(max_length=_pii_length(120))
     dob = models.DateField(blank=True, null=True)
     gender = models.CharField(max_length=10, choices=GENDER_CHOICES, blank=True)
     country_code = models.CharField(max_length=8, default='+353')
 
-    phone = models.CharField(max_length=50)
+    phone = models.CharField(max_length=_pii_length(50))
     agree_sms = models.BooleanField(default=False)
-    address = models.CharField(max_length=255, blank=True)
+    address = models.CharField(max_length=_pii_length(255), blank=True)
 
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        # archive_people 의 (created_at, id) keyset 순회용
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='person_created_at_id_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_stored_pii()
+        return instance
+
+    def _remember_stored_pii(self):
+        # DB 에 있는(=이미 암호화된) 값. 값 모양으로 암호문인지 추측하지 않고 이것과 비교한다
+        self._stored_pii = {f: self.__dict__[f] for f in self.PII_FIELDS if f in self.__dict__}
+
     # ✅ 저장 시 항상 PII 필드 암호화 보증(토글 True일 때만)
     def save(self, *args, **kwargs):
         # 비밀번호는 해시로 유지 (변경 없음)
         # 암호화 대상: email, full_name, phone, address  (dob은 date 타입이므로 여기선 제외)
-        if self.email and not _is_encrypted(self.email):
-            self.email = _enc(self.email)
-        if self.full_name and not _is_encrypted(self.full_name):
-            self.full_name = _enc(self.full_name)
-        if self.phone and not _is_encrypted(self.phone):
-            self.phone = _enc(self.phone)
-        if self.address and not _is_encrypted(self.address):
-            self.address = _enc(self.address)
-        super().save(*args, **kwargs)
+        # DB 에서 읽은 값 그대로면 건너뛰고, 새로 들어온 값은 ("a1:..." 처럼 보여도) 암호화
+        stored = getattr(self, "_stored_pii", {})
+        with PHASE_LATENCY.time(phase="encrypt"):
+            for field in self.PII_FIELDS:
+                value = self.__dict__.get(field)   # deferred 필드는 로딩하지 않음
+                if value and (field not in stored or value != stored[field]):
+                    setattr(self, field, _enc(value))
+        adding = self._state.adding
+        with PHASE_LATENCY.time(phase="db_save"), transaction.atomic():
+            super().save(*args, **kwargs)
+            # 통계 롤업도 같은 트랜잭션에서 갱신 (insert 일 때만)
+            if adding:
+                SignupDailyStat.add([self])
+        self._remember_stored_pii()
 
     def set_password(self, raw_password):
-        self.password_hash = make_password(raw_password)
+        with PHASE_LATENCY.time(phase="password_hash"):
+            self.password_hash = make_password(raw_password)
 
     def check_password(self, raw_password):
         return check_password(raw_password, self.password_hash)
 
+    def decrypted(self, field):
+        """PII 필드 평문 (암호문이면 복호화)"""
+        return _dec(getattr(self, field) or "")
+
     # 🔒 암호문일 때도 깨지지 않도록 마스킹 수정
     def masked_phone(self):
         p = (self.phone or "")
@@ -92,3 +111,40 @@ class Person(models.Model):
     def __str__(self):
         # full_name이 암호문일 수 있으니 username만 표시
         return f"{self.username}"
+
+
+class SignupDailyStat(models.Model):
+    """
+    (날짜, role, gender) 별 가입 수 롤업 — Person insert 마다 증분 갱신.
+    /stats 는 Person 대신 이 테이블만 읽는다 (크기가 row 수가 아니라 날짜 수에 비례).
+    archive_people 로 Person 을 지워도 가입 기록이므로 줄이지 않는다.
+    """
+    day = models.DateField()
+    role = models.CharField(max_length=20)
+    gender = models.CharField(max_length=10, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'role', 'gender'], name='signup_stat_unique_bucket'),
+        ]
+
+    @classmethod
+    def add(cls, people):
+        """가입자 목록을 bucket 별로 묶어 count 증가 (호출하는 쪽 트랜잭션 안에서 실행)"""
+        buckets = Counter(
+            (timezone.localdate(p.created_at), p.role, p.gender or '') for p in people
+        )
+        for (day, role, gender), n in buckets.items():
+            updated = cls.objects.filter(day=day, role=role, gender=gender).update(count=F('count') + n)
+            if updated:
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(day=day, role=role, gender=gender, count=n)
+            except IntegrityError:
+                # 동시에 같은 bucket 을 만든 경우 → 증가로 처리
+                cls.objects.filter(day=day, role=role, gender=gender).update(count=F('count') + n)
+
+    def __str__(self):
+        return f"{self.day} {self.role}/{self.gender or '-'}: {self.count}"
@@ -0,0 +1,22 @@
+# experiment/signup_workers.py
+# batch_signup 의 프로세스 풀에서 실행되는 함수들.
+# spawn 된 워커가 이 모듈을 unpickle 할 때는 아직 Django 가 준비되지 않았으므로
+# 여기서는 models 를 import 하면 안 된다 (settings / hasher / crypto 만 사용).
+import os
+
+from django.contrib.auth.hashers import make_password
+
+from .crypto import encrypt
+
+
+def init_worker():
+    # 새 인터프리터 → settings / hasher 준비
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "thesis.settings")
+    import django
+    django.setup()
+
+
+def prepare_secrets(args):
+    """(raw password, PII dict) → (password hash, 암호화된 PII dict)"""
+    raw_password, pii = args
+    return make_password(raw_password), {field: encrypt(value) for field, value in pii.items()}
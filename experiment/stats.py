@@ -0,0 +1,82 @@
+# experiment/stats.py
+# 가입 통계: SignupDailyStat 롤업 → 대시보드용 JSON (캐시)
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Person, SignupDailyStat
+
+CACHE_KEY = "experiment:signup-stats:{days}"
+# /stats?days= 로 허용하는 기간 (캐시 key 가 무한히 늘지 않도록 고정)
+DAY_CHOICES = (7, 30, 90)
+
+
+def build_stats(days=30):
+    """롤업 테이블에서 최근 days 일 bucket 만 SQL 로 합산 (role / gender / 날짜별)"""
+    since = timezone.localdate() - timedelta(days=days - 1)
+    rows = SignupDailyStat.objects.filter(day__gte=since).order_by()
+
+    def totals(field):
+        return rows.values_list(field).annotate(n=Sum('count')).order_by(field)
+
+    by_role = dict(totals('role'))
+    by_gender = {(g or 'unspecified'): n for g, n in totals('gender')}
+    return {
+        "total": sum(by_role.values()),
+        "by_role": by_role,
+        "by_gender": by_gender,
+        "by_day": [{"day": d.isoformat(), "count": n} for d, n in totals('day')],
+        "days": days,
+        "generated_at": timezone.now().isoformat(),
+    }
+
+
+def cached_stats(days=30):
+    key = CACHE_KEY.format(days=days)
+    stats = cache.get(key)
+    if stats is None:
+        stats = build_stats(days)
+        cache.set(key, stats, getattr(settings, "SIGNUP_STATS_CACHE_SECONDS", 30))
+    return stats
+
+
+def rebuild(since=None):
+    """
+    Person 으로 롤업 재작성. 반환: 다시 쓴 bucket 수
+    archive_people 로 지운 기간은 Person 에 없으므로 since 이전 날짜는 건드리지 않는다
+    (기본 since = 남아 있는 가장 오래된 Person 의 날짜). 그 날짜는 일부만 archive 됐을 수
+    있어서 bucket 별로 기존 값과 다시 센 값 중 큰 쪽을 남긴다.
+    """
+    with transaction.atomic():
+        boundary = since is None
+        if boundary:
+            oldest = Person.objects.order_by('created_at').values_list('created_at', flat=True).first()
+            if oldest is None:
+                return 0
+            since = timezone.localtime(oldest).date()
+
+        rows = (
+            Person.objects.annotate(day=TruncDate('created_at'))
+            .filter(day__gte=since)
+            .values('day', 'role', 'gender')
+            .annotate(n=Count('id'))
+            .order_by()
+        )
+        counts = {(r['day'], r['role'], r['gender'] or ''): r['n'] for r in rows}
+        if boundary:
+            for role, gender, n in SignupDailyStat.objects.filter(day=since).values_list('role', 'gender', 'count'):
+                key = (since, role, gender)
+                counts[key] = max(counts.get(key, 0), n)
+
+        SignupDailyStat.objects.filter(day__gte=since).delete()
+        SignupDailyStat.objects.bulk_create(
+            [SignupDailyStat(day=d, role=r, gender=g, count=n) for (d, r, g), n in counts.items()],
+            batch_size=500,
+        )
+    cache.delete_many([CACHE_KEY.format(days=d) for d in DAY_CHOICES])
+    return len(counts)
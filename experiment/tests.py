@@ -1,3 +1,642 @@
-from django.test import TestCase
+import io
+import os
+import csv
+import json
+import time
+import sys
+import shutil
+import tempfile
+import subprocess
+import tracemalloc
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from unittest import mock
 
-# Create your tests here.
+from cryptography.fernet import Fernet
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone as django_timezone
+
+from . import archive, batch_signup, crypto, dynamo, stats
+from .forms import PersonForm
+from .metrics import REGISTRY, Registry
+from .models import Person, SignupDailyStat
+from .signup_workers import prepare_secrets
+
+# 성능 회귀 테스트
+# - 쿼리 수: assertNumQueries 로 정확히 고정 (N+1 이 생기면 바로 실패)
+# - 시간: 머신 속도 차이를 없애기 위해 고정 CPU 작업(calibrate) 대비 배수로 budget 설정
+# - 메모리: tracemalloc peak 상한
+# DynamoDB 는 FakeTable 로 대체 (네트워크 없음)
+
+TEST_FERNET_KEY = Fernet.generate_key().decode()
+
+
+def tearDownModule():
+    # 테스트 요청이 쌓은 지표를 종료 시 METRICS_DIR 에 flush 하지 않도록
+    for metric in REGISTRY.metrics.values():
+        metric.values = {}
+
+
+def _calibrate(repeat=5):
+    """기준 CPU 작업 1회 시간 (best of N) — 시간 budget 의 단위"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sum(i * i for i in range(100_000))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _best_time(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class FakeTable:
+    """DynamoDB Table 대체 (put_item / batch_writer 기록만)"""
+
+    def __init__(self):
+        self.items = []
+
+    def put_item(self, Item):
+        self.items.append(Item)
+
+    def batch_writer(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def signup_data(username="alice", **overrides):
+    data = {
+        "role": "guest",
+        "username": username,
+        "password": "s3cret-pass",
+        "email": "alice@example.com",
+        "full_name": "Alice Kim",
+        "dob": "1990-01-01",
+        "gender": "female",
+        "country_code": "+353",
+        "phone": "0871234567",
+        "address": "1 Main Street",
+    }
+    data.update(overrides)
+    return data
+
+
+@override_settings(
+    ENCRYPTION_ENABLED=True,
+    FERNET_KEY=TEST_FERNET_KEY,
+    METRICS_DIR="",   # 테스트 중 metrics 스냅샷 파일 쓰지 않음
+)
+class PerfBudgetTestCase(TestCase):
+    # 시간 budget: calibrate() 대비 배수 (측정치의 15~25배 여유 — CI 노이즈 흡수, 자릿수 단위 회귀만 잡음)
+    INDEX_GET_BUDGET = 10
+    PERSON_SAVE_BUDGET = 3
+    # 메모리 budget (bytes)
+    INDEX_GET_PEAK = 1024 * 1024
+    PERSON_SAVE_PEAK = 256 * 1024
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.unit = _calibrate()
+
+    def setUp(self):
+        self.table = FakeTable()
+        patcher = mock.patch("experiment.views.signups_table", return_value=self.table)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertWithinBudget(self, seconds, multiple, label):
+        budget = self.unit * multiple
+        self.assertLessEqual(
+            seconds, budget,
+            f"{label}: {seconds * 1000:.2f} ms > budget {budget * 1000:.2f} ms ({multiple}x calibration)",
+        )
+
+    def make_person(self, username, **fields):
+        person = Person(username=username, full_name="Bob Lee", phone="0870000000", email="b@example.com", **fields)
+        person.password_hash = "pbkdf2_sha256$1$salt$hash"   # 해싱 비용은 signup 테스트에서만
+        return person
+
+
+class IndexViewPerfTests(PerfBudgetTestCase):
+    def test_get_queries_time_and_memory(self):
+        url = reverse("experiment:index")
+        self.client.get(url)   # 템플릿 로딩 등 첫 요청 비용 제외
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.assertWithinBudget(_best_time(lambda: self.client.get(url)), self.INDEX_GET_BUDGET, "index GET")
+        self.assertLess(_peak_bytes(lambda: self.client.get(url)), self.INDEX_GET_PEAK)
+
+    def test_post_signup_query_budget(self):
+        # savepoint/release + person insert + stat update + (새 bucket 이라) savepoint/release + stat insert
+        with self.assertNumQueries(7):
+            response = self.client.post(reverse("experiment:index"), signup_data())
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["saved"])
+
+        person = Person.objects.get(username="alice")
+        self.assertTrue(person.phone.startswith("a1:"))
+        self.assertEqual(person.decrypted("phone"), "0871234567")
+        self.assertEqual(len(self.table.items), 1)
+        self.assertEqual(SignupDailyStat.objects.get().count, 1)
+
+    def test_post_signup_existing_stat_bucket(self):
+        self.client.post(reverse("experiment:index"), signup_data("first"))
+        # 같은 (day, role, gender) bucket → update 만 (insert 없음)
+        with self.assertNumQueries(4):
+            self.client.post(reverse("experiment:index"), signup_data("second"))
+        self.assertEqual(SignupDailyStat.objects.get().count, 2)
+
+    def test_invalid_post_does_not_touch_db(self):
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse("experiment:index"), signup_data(email="not-an-email"))
+        self.assertFalse(response.context["saved"])
+        self.assertEqual(self.table.items, [])
+
+
+class PersonSavePerfTests(PerfBudgetTestCase):
+    def _save_many(self, prefix, n=20):
+        for i in range(n):
+            self.make_person(f"{prefix}{i}").save()
+
+    def test_save_with_encryption(self):
+        with self.assertNumQueries(7):
+            self.make_person("enc").save()
+        self.assertTrue(Person.objects.get(username="enc").email.startswith("a1:"))
+
+        per_save = _best_time(lambda: self._save_many(f"e{time.perf_counter_ns()}-")) / 20
+        self.assertWithinBudget(per_save, self.PERSON_SAVE_BUDGET, "Person.save (encrypted)")
+        self.assertLess(_peak_bytes(lambda: self.make_person("enc-mem").save()), self.PERSON_SAVE_PEAK)
+
+    @override_settings(ENCRYPTION_ENABLED=False)
+    def test_save_without_encryption(self):
+        with self.assertNumQueries(7):
+            self.make_person("plain").save()
+        self.assertEqual(Person.objects.get(username="plain").email, "b@example.com")
+
+        per_save = _best_time(lambda: self._save_many(f"p{time.perf_counter_ns()}-")) / 20
+        self.assertWithinBudget(per_save, self.PERSON_SAVE_BUDGET, "Person.save (plaintext)")
+
+    def test_update_does_not_touch_stats(self):
+        person = self.make_person("upd")
+        person.save()
+        person.phone = "0879999999"
+        # 업데이트는 savepoint/release + UPDATE 만 (롤업 갱신 없음)
+        with self.assertNumQueries(3):
+            person.save()
+        self.assertEqual(SignupDailyStat.objects.get().count, 1)
+
+
+class PersonAdminPerfTests(PerfBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(self.admin)
+        self.url = reverse("admin:experiment_person_changelist")
+
+    def _changelist_queries(self, n_people):
+        Person.objects.all().delete()
+        Person.objects.bulk_create(self.make_person(f"u{i}") for i in range(n_people))
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_changelist_query_count_is_constant(self):
+        # row 수가 늘어도 쿼리 수는 그대로여야 함 (N+1 방지)
+        self.assertEqual(self._changelist_queries(3), self._changelist_queries(60))
+
+    def test_changelist_query_budget(self):
+        Person.objects.bulk_create(self.make_person(f"u{i}") for i in range(30))
+        # session + user + count + 필터용 count + page
+        with self.assertNumQueries(5):
+            self.client.get(self.url)
+
+
+class ShardQueryTable:
+    """pk / created_shard 파티션별로 item 을 돌려주는 Query 대체 (페이지당 1개)"""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def query(self, KeyConditionExpression, ExclusiveStartKey=None, IndexName=None, Limit=None):
+        self.calls += 1
+        cond = KeyConditionExpression.get_expression()
+        if IndexName:   # created_shard = x AND created_at BETWEEN lo AND hi
+            eq, between = cond["values"]
+            attr, value = eq.get_expression()["values"]
+            lo, hi = between.get_expression()["values"][1:]
+            rows = [i for i in self.items if i[attr.name] == value and lo <= i["created_at"] <= hi]
+            rows.sort(key=lambda i: i["created_at"])
+        else:
+            attr, value = cond["values"]
+            rows = sorted((i for i in self.items if i[attr.name] == value), key=lambda i: i["username"])
+        start = ExclusiveStartKey["n"] if ExclusiveStartKey else 0
+        resp = {"Items": rows[start:start + 1]}
+        if start + 1 < len(rows):
+            resp["LastEvaluatedKey"] = {"n": start + 1}
+        return resp
+
+
+@override_settings(DDB_WRITE_SHARDS=4, ENCRYPTION_ENABLED=False)
+class DynamoShardingTests(TestCase):
+    def _items(self, n=12):
+        base = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+        people = [
+            Person(role="guest", username=f"user{i}", phone="1", created_at=base + timedelta(minutes=i))
+            for i in range(n)
+        ]
+        return base, [dynamo.person_item(p) for p in people]
+
+    def test_person_item_spreads_writes_over_shards(self):
+        _, items = self._items(40)
+        self.assertEqual(len({i["pk"] for i in items}), 4)
+        for item in items:
+            self.assertTrue(item["pk"].startswith("guest#"))
+            self.assertEqual(item["created_shard"], f"2026-10-19#{item['pk'][-2:]}")
+
+    def test_scatter_gather_merges_shards_in_order(self):
+        base, items = self._items()
+        table = ShardQueryTable(items)
+        got = list(dynamo.iter_signups_between(base, base + timedelta(minutes=5), table=table))
+        self.assertEqual([i["username"] for i in got], [f"user{i}" for i in range(6)])
+        self.assertEqual([i["username"] for i in dynamo.iter_role("guest", table=table)],
+                         sorted(i["username"] for i in items))
+
+    def test_iter_role_streams_pages(self):
+        _, items = self._items(40)
+        table = ShardQueryTable(items)
+        stream = dynamo.iter_role("guest", table=table)
+        self.assertEqual(next(stream)["username"], "user0")
+        # 첫 item 을 받을 때까지 샤드당 현재 페이지 + 미리 받은 다음 페이지만 요청 (1 item/page)
+        self.assertLessEqual(table.calls, 2 * 4)
+        self.assertEqual(len(list(stream)), 39)
+        self.assertEqual(table.calls, 40)
+
+    def test_reshard_legacy_item(self):
+        _, items = self._items(1)
+        legacy = {k: v for k, v in items[0].items() if k not in ("pk", "created_shard")}
+        self.assertEqual(dynamo.reshard_item(legacy), items[0])
+
+        # 예전 형식의 타임스탬프 (공백 구분 / 마이크로초 없음 / 다른 UTC offset) 는 고정 형식으로
+        legacy["created_at"] = "2026-10-19 13:30:00+01:00"
+        legacy.pop("created_day")
+        item = dynamo.reshard_item(legacy)
+        self.assertEqual(item["created_at"], "2026-10-19T12:30:00.000000+00:00")
+        self.assertEqual(item["created_shard"], f"2026-10-19#{item['pk'][-2:]}")
+
+
+@override_settings(
+    SIGNUP_API_TOKEN="test-token",
+    SIGNUP_BATCH_MAX=50,
+    SIGNUP_HASH_WORKERS=0,   # 테스트에서는 프로세스 풀 대신 현재 프로세스에서
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+)
+class SignupBatchApiTests(PerfBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch("experiment.batch_signup.signups_table", return_value=self.table)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = reverse("experiment:signup_batch")
+
+    def post(self, payload, content_type="application/json", token="test-token"):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        body = payload if isinstance(payload, str) else json.dumps(payload)
+        return self.client.post(self.url, body, content_type=content_type, **headers)
+
+    def results(self, response):
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        return [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+    def test_requires_token(self):
+        self.assertEqual(self.post([signup_data()], token=None).status_code, 401)
+        self.assertEqual(self.post([signup_data()], token="wrong").status_code, 401)
+        self.assertFalse(Person.objects.exists())
+
+    def test_rejects_oversized_batch(self):
+        batch = [signup_data(f"u{i}") for i in range(51)]
+        self.assertEqual(self.post(batch).status_code, 413)
+
+    def test_mixed_batch_results(self):
+        Person(username="taken", full_name="x", phone="1").save()
+        batch = [
+            signup_data("new1"),
+            signup_data("taken"),
+            signup_data("bad", email="nope"),
+            signup_data("new1"),
+            signup_data("new2", role="employee"),
+        ]
+        rows = self.results(self.post({"signups": batch}))
+        by_index = {r["index"]: r["status"] for r in rows if "index" in r}
+        self.assertEqual(by_index, {0: "created", 1: "conflict", 2: "invalid", 3: "conflict", 4: "created"})
+        self.assertEqual(rows[-1]["summary"], {"created": 2, "invalid": 1, "conflict": 2, "error": 0, "total": 5})
+
+        person = Person.objects.get(username="new1")
+        self.assertTrue(person.phone.startswith("a1:"))
+        self.assertTrue(person.check_password("s3cret-pass"))
+        self.assertEqual(sorted(i["username"] for i in self.table.items), ["new1", "new2"])
+        self.assertEqual(sum(SignupDailyStat.objects.values_list("count", flat=True)), 3)
+
+    def test_ndjson_bulk_insert_query_budget(self):
+        body = "\n".join(json.dumps(signup_data(f"u{i}")) for i in range(50))
+        response = self.post(body, content_type="application/x-ndjson")
+        # 중복 조회 1 + savepoint/release + bulk insert + stat update + savepoint/release + stat insert
+        # — 레코드 수와 무관
+        with self.assertNumQueries(8):
+            rows = self.results(response)
+        self.assertEqual(rows[-1]["summary"]["created"], 50)
+        self.assertEqual(len(self.table.items), 50)
+
+    @override_settings(
+        SIGNUP_HASH_WORKERS=1,
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.PBKDF2PasswordHasher"],
+    )
+    def test_process_pool_path(self):
+        # spawn 된 풀 프로세스는 override_settings 가 아니라 환경변수로 settings 를 읽는다
+        env = {"FERNET_KEY": TEST_FERNET_KEY, "METRICS_DIR": ""}
+        with mock.patch.dict(os.environ, env):
+            self.addCleanup(lambda: batch_signup._discard_pool(batch_signup._pool))
+            rows = list(batch_signup.process([signup_data("pool1"), signup_data("pool2")]))
+        self.assertEqual(rows[-1]["summary"]["created"], 2)
+        person = Person.objects.get(username="pool2")
+        self.assertTrue(person.check_password("s3cret-pass"))
+        self.assertEqual(person.decrypted("phone"), "0871234567")
+
+    def test_broken_pool_is_replaced_and_reported(self):
+        class DyingPool:
+            shut_down = False
+
+            def map(self, fn, jobs, chunksize=1):
+                jobs = iter(jobs)
+                yield prepare_secrets(next(jobs))
+                raise BrokenProcessPool("worker killed")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        pool = DyingPool()
+        batch_signup._pool = pool
+        with mock.patch.object(batch_signup, "_executor", return_value=pool), \
+                mock.patch.object(batch_signup, "INSERT_CHUNK", 1):
+            rows = list(batch_signup.process([signup_data(f"b{i}") for i in range(3)]))
+
+        self.assertEqual([r["status"] for r in rows[:-1]], ["created", "error", "error"])
+        self.assertEqual(rows[-1]["summary"], {"created": 1, "invalid": 0, "conflict": 0, "error": 2, "total": 3})
+        self.assertTrue(pool.shut_down)
+        self.assertIsNone(batch_signup._pool)
+
+    def test_existing_username_is_reported_as_conflict(self):
+        self.make_person("race").save()
+        rows = self.results(self.post([signup_data("race"), signup_data("ok")]))
+        self.assertEqual(rows[0], {"index": 0, "status": "conflict", "username": "race",
+                                   "errors": {"username": ["already exists"]}})
+        self.assertEqual(rows[1]["status"], "created")
+        self.assertEqual(rows[-1]["summary"], {"created": 1, "invalid": 0, "conflict": 1, "error": 0, "total": 2})
+        self.assertEqual(Person.objects.filter(username="race").count(), 1)
+
+    def test_insert_conflict_falls_back_per_record(self):
+        # 사전 중복 검사 이후 다른 요청이 같은 username 을 먼저 넣은 상황: 실제 UNIQUE 위반으로 재현
+        self.make_person("race").save()
+        people = [batch_signup.unsaved_person(signup_data(name)) for name in ("race", "ok")]
+        saved, conflicts = batch_signup._insert_chunk(people)
+        self.assertEqual([p.username for p in saved], ["ok"])
+        self.assertEqual([p.username for p in conflicts], ["race"])
+        self.assertTrue(Person.objects.filter(username="ok").exists())
+        self.assertEqual(Person.objects.filter(username="race").count(), 1)
+
+@override_settings(ENCRYPTION_ENABLED=True, FERNET_KEY=TEST_FERNET_KEY, PII_CIPHER="aesgcm", METRICS_DIR="")
+class PiiEncryptionTests(TestCase):
+    def make(self, **fields):
+        data = {"username": "carol", "full_name": "Carol", "phone": "+353871234567"}
+        data.update(fields)
+        person = Person(**data)
+        person.save()
+        return Person.objects.get(pk=person.pk)
+
+    def test_plaintext_that_looks_like_ciphertext_is_encrypted(self):
+        lookalike = "gAAAA" + "x" * 120
+        person = self.make(address="a1: flat 3", full_name=lookalike)
+        self.assertNotEqual(person.address, "a1: flat 3")
+        self.assertEqual(person.decrypted("address"), "a1: flat 3")
+        self.assertEqual(person.decrypted("full_name"), lookalike)
+
+    def test_resave_does_not_double_encrypt(self):
+        person = Person(username="dave", full_name="Dave", phone="0871")
+        person.save()
+        person.save()
+        loaded = Person.objects.get(pk=person.pk)
+        loaded.save()
+        self.assertEqual(Person.objects.get(pk=person.pk).decrypted("phone"), "0871")
+        self.assertEqual(loaded.decrypted("full_name"), "Dave")
+
+    def test_legacy_fernet_values_decrypt_and_reencrypt(self):
+        token = Fernet(TEST_FERNET_KEY.encode()).encrypt(b"1 Old Road").decode()
+        person = self.make()
+        Person.objects.filter(pk=person.pk).update(address=token)
+        self.assertEqual(Person.objects.get(pk=person.pk).decrypted("address"), "1 Old Road")
+
+        call_command("reencrypt_pii", stdout=open(os.devnull, "w"))
+        address = Person.objects.get(pk=person.pk).address
+        self.assertTrue(address.startswith("a1:"))
+        self.assertEqual(Person.objects.get(pk=person.pk).decrypted("address"), "1 Old Road")
+
+    def test_reencrypt_skips_undecryptable_values(self):
+        good = Fernet(TEST_FERNET_KEY.encode()).encrypt(b"1 Old Road").decode()
+        bad = Fernet(Fernet.generate_key()).encrypt(b"other key").decode()
+        broken = self.make(username="broken")
+        fine = self.make(username="fine")
+        Person.objects.filter(pk=broken.pk).update(address=bad)
+        Person.objects.filter(pk=fine.pk).update(address=good)
+
+        err = io.StringIO()
+        call_command("reencrypt_pii", batch_size=1, stdout=io.StringIO(), stderr=err)
+        self.assertIn(f"skip pk={broken.pk} field=address", err.getvalue())
+        self.assertEqual(Person.objects.get(pk=broken.pk).address, bad)
+        self.assertTrue(Person.objects.get(pk=fine.pk).address.startswith("a1:"))
+        self.assertEqual(Person.objects.get(pk=fine.pk).decrypted("address"), "1 Old Road")
+
+    def test_columns_fit_ciphertext_of_longest_form_input(self):
+        form_fields = PersonForm.base_fields
+        for field, max_chars in (("full_name", 120), ("phone", 50), ("address", 255)):
+            self.assertEqual(form_fields[field].max_length, max_chars)
+            for cipher in ("aesgcm", "fernet"):
+                with self.settings(PII_CIPHER=cipher):
+                    ciphertext = crypto.encrypt("😀" * max_chars)
+                self.assertLessEqual(len(ciphertext), Person._meta.get_field(field).max_length, (field, cipher))
+
+
+class MetricsRegistryTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        # 테스트마다 atexit/fork 훅이 쌓이지 않도록 훅 없는 registry
+        self.registry = Registry(install_hooks=False)
+        self.counter = self.registry.counter("test_total", "Test counter.", ("kind",))
+
+    def files(self):
+        return sorted(f for f in os.listdir(self.dir) if f.endswith(".json"))
+
+    def test_flush_skips_when_nothing_recorded(self):
+        with self.settings(METRICS_DIR=self.dir):
+            self.registry.flush()
+            self.assertEqual(self.files(), [])
+            self.counter.inc(kind="a")
+            self.registry.flush()
+        self.assertEqual(self.files(), [f"metrics-{self.registry.instance_id}.json"])
+
+    def test_dead_process_files_are_compacted(self):
+        dead_pid = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                                  capture_output=True, text=True).stdout.strip()
+        for token in ("aaaa", "bbbb"):
+            with open(os.path.join(self.dir, f"metrics-{dead_pid}-{token}.json"), "w") as f:
+                json.dump({"test_total": [[["a"], 2]]}, f)
+
+        with self.settings(METRICS_DIR=self.dir):
+            self.counter.inc(kind="a")
+            self.assertIn('test_total{kind="a"} 5', self.registry.render())
+            self.assertEqual(self.files(), sorted(["metrics-archive.json", f"metrics-{self.registry.instance_id}.json"]))
+            # 다시 scrape 해도 archive 가 중복 집계되지 않음
+            self.assertIn('test_total{kind="a"} 5', self.registry.render())
+
+
+@override_settings(ENCRYPTION_ENABLED=False, METRICS_DIR="")
+class SignupStatsTests(TestCase):
+    def add(self, username, days_ago, role="guest", gender="female"):
+        created = django_timezone.now() - timedelta(days=days_ago)
+        Person(username=username, role=role, gender=gender, full_name="x", phone="1", created_at=created).save()
+
+    def test_totals_respect_days_window(self):
+        self.add("recent", 1)
+        self.add("old", 60, role="employee", gender="male")
+        week = stats.build_stats(7)
+        self.assertEqual((week["total"], week["by_role"], week["by_gender"]), (1, {"guest": 1}, {"female": 1}))
+        self.assertEqual(len(week["by_day"]), 1)
+        self.assertEqual(stats.build_stats(90)["total"], 2)
+
+    def test_rebuild_keeps_archived_history(self):
+        self.add("archived", 40)
+        self.add("oldest-kept", 15)
+        self.add("kept", 10)
+        Person.objects.filter(username="archived").delete()   # archive_people 와 동일 (롤업은 그대로)
+        # 남은 Person 으로 완전히 덮이는 날짜의 틀어진 값은 rebuild 가 고친다
+        SignupDailyStat.objects.filter(day=django_timezone.localdate() - timedelta(days=10)).update(count=99)
+
+        stats.rebuild()
+        self.assertEqual(stats.build_stats(90)["total"], 3)
+        self.assertEqual(stats.build_stats(30)["total"], 2)
+
+
+@override_settings(ENCRYPTION_ENABLED=True, FERNET_KEY=TEST_FERNET_KEY, METRICS_DIR="")
+class ExportTests(TestCase):
+    def test_export_neutralizes_formulas(self):
+        Person(username="@evil", full_name="=HYPERLINK(\"http://x\")", phone="+353871234567",
+               address="-2+3", email="e@example.com").save()
+        out = io.StringIO()
+        call_command("export_people", stdout=out)
+        header, row = list(csv.reader(io.StringIO(out.getvalue())))
+        row = dict(zip(header, row))
+        self.assertEqual(row["username"], "'@evil")
+        self.assertEqual(row["full_name"], "'=HYPERLINK(\"http://x\")")
+        self.assertEqual(row["phone"], "'+353871234567")
+        self.assertEqual(row["address"], "'-2+3")
+        self.assertEqual(row["email"], "e@example.com")
+
+
+@override_settings(ENCRYPTION_ENABLED=False, FERNET_KEY=TEST_FERNET_KEY, METRICS_DIR="")
+class ArchiveTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.cutoff = django_timezone.now() - timedelta(days=30)
+
+    def add(self, username, created_at):
+        person = Person(username=username, full_name="x", phone="1", created_at=created_at)
+        person.save()
+        return person.pk
+
+    def archive(self, **options):
+        options.setdefault("sleep", 0)
+        call_command("archive_people", older_than="30d", archive_dir=self.dir, stdout=open(os.devnull, "w"), **options)
+
+    def archived_ids(self):
+        ids = []
+        for name in sorted(os.listdir(self.dir)):
+            ids.extend(r["id"] for r in archive.read_archive(os.path.join(self.dir, name)))
+        return ids
+
+    def test_keyset_pages_rows_with_same_created_at(self):
+        same = self.cutoff - timedelta(days=1)
+        ids = [self.add(f"tie{i}", same) for i in range(5)]
+        chunks = [[r["id"] for r in rows] for rows in archive.iter_chunks(self.cutoff, 2)]
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        self.assertEqual(sum(chunks, []), sorted(ids))
+
+    def test_resume_after_max_chunks(self):
+        old = [self.add(f"old{i}", self.cutoff - timedelta(days=10 - i)) for i in range(5)]
+        recent = self.add("recent", self.cutoff + timedelta(days=1))
+
+        self.archive(chunk_size=2, max_chunks=1)
+        self.assertEqual(Person.objects.filter(pk__in=old).count(), 3)
+        self.archive(chunk_size=2)
+
+        self.assertFalse(Person.objects.filter(pk__in=old).exists())
+        self.assertEqual(sorted(self.archived_ids()), sorted(old))   # 빠지거나 두 번 보관된 row 없음
+        self.assertTrue(Person.objects.filter(pk=recent).exists())
+
+    def test_rows_newer_than_cutoff_are_left_alone(self):
+        recent = [self.add(f"new{i}", self.cutoff + timedelta(hours=i + 1)) for i in range(3)]
+        self.archive()
+        self.assertEqual(Person.objects.filter(pk__in=recent).count(), 3)
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_sealed_chunk_round_trip(self):
+        self.add("sealed", self.cutoff - timedelta(days=1))
+        rows = next(archive.iter_chunks(self.cutoff, 10))
+        path = archive.write_chunk(rows, self.dir)
+        with open(path, "rb") as f:
+            blob = f.read()
+        self.assertTrue(blob.startswith(crypto.ARCHIVE_MAGIC))
+        self.assertNotIn(b"sealed", blob)
+
+        restored = archive.read_archive(path)
+        self.assertEqual([(r["id"], r["username"]) for r in restored], [(rows[0]["id"], "sealed")])
+        with self.settings(FERNET_KEY=Fernet.generate_key().decode()):
+            with self.assertRaises(crypto.DecryptionError):
+                archive.read_archive(path)
+
+    def test_failed_verification_keeps_rows(self):
+        pk = self.add("keep", self.cutoff - timedelta(days=1))
+        with mock.patch("experiment.management.commands.archive_people.verify_chunk", return_value=False):
+            with self.assertRaises(CommandError):
+                self.archive()
+        self.assertTrue(Person.objects.filter(pk=pk).exists())
@@ -4,4 +4,7 @@ from . import views
 app_name = 'experiment'
 urlpatterns = [
     path('', views.index, name='index'),
+    path('metrics', views.metrics, name='metrics'),
+    path('stats', views.signup_stats, name='signup_stats'),
+    path('api/signups/batch', views.signup_batch, name='signup_batch'),
 ]
@@ -1,49 +1,49 @@
 # experiment/views.py
-from django.shortcuts import render
-from .models import Person
-from .forms import PersonForm
+import hmac
+import time
 
-import boto3
 from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from .forms import PersonForm
+from .metrics import REGISTRY, REQUESTS, REQUEST_LATENCY, FORM_ERRORS, PHASE_LATENCY, DDB_ERRORS
+from .dynamo import signups_table, person_item
+from . import stats
+from .batch_signup import BatchError, parse_records, iter_ndjson, unsaved_person
 
 def build_person_from_form(cleaned_data):
-    p = Person(
-        role=cleaned_data.get('role') or 'employee',
-        username=cleaned_data['username'],
-        email=cleaned_data.get('email'),
-        full_name=cleaned_data['full_name'],
-        dob=cleaned_data.get('dob'),
-        gender=cleaned_data.get('gender') or '',
-        country_code=cleaned_data.get('country_code'),
-        phone=cleaned_data['phone'],
-        address=cleaned_data.get('address') or '',
-    )
+    p = unsaved_person(cleaned_data)
     p.set_password(cleaned_data['password'])
     return p
 
 
 def save_person_to_dynamodb(person):
     try:
-        ddb = boto3.resource('dynamodb', region_name=settings.AWS_REGION)
-        table = ddb.Table(settings.DDB_TABLE_SIGNUPS)
-        created_at = getattr(person, "created_at", None)
-
-        item = {
-            "role": person.role,                     # PK
-            "username": person.username,             # SK
-            "email": person.email or "",
-            "phone": person.phone or "",
-            "address": person.address or "",
-            "created_at": created_at.isoformat() if hasattr(created_at, "isoformat") else str(created_at),
-            "mode_encrypted": bool(getattr(settings, "ENCRYPTION_ENABLED", False)),
-        }
-        table.put_item(Item=item)
+        table = signups_table()
+        item = person_item(person)
+        with PHASE_LATENCY.time(phase="dynamodb_put"):
+            table.put_item(Item=item)
         print("[DDB] put_item OK:", item["role"], item["username"])
 
     except Exception as e:
+        DDB_ERRORS.inc()
         print("[DDB] put_item ERROR:", e)
 
 def index(request):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = _index(request)
+        status = response.status_code
+        return response
+    finally:
+        REQUEST_LATENCY.observe(time.perf_counter() - start, method=request.method)
+        REQUESTS.inc(method=request.method, status=status)
+
+
+def _index(request):
     saved = False
     # POST면 데이터 바인딩, 아니면 빈 폼
     form = PersonForm(request.POST or None)
@@ -57,8 +57,42 @@ def index(request):
         form = PersonForm()  # 폼 초기화해서 빈 폼 다시 보여줌
     elif request.method == 'POST':
         # 유효성 실패 시
+        FORM_ERRORS.inc()
         print("❌ Form errors:", form.errors)
 
     return render(request, 'index.html', {'form': form, 'saved': saved})
-    
-    
\ No newline at end of file
+
+
+def metrics(request):
+    """Prometheus text format (모든 워커 합산)"""
+    return HttpResponse(REGISTRY.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def signup_stats(request):
+    """가입 통계 JSON (?days=7|30|90) — 롤업 테이블 + 캐시라 Person row 수와 무관"""
+    try:
+        days = int(request.GET.get('days', 30))
+    except ValueError:
+        days = 30
+    if days not in stats.DAY_CHOICES:
+        days = 30
+    return JsonResponse(stats.cached_stats(days))
+
+
+def _api_token_ok(request):
+    token = settings.SIGNUP_API_TOKEN
+    scheme, _, given = request.headers.get('Authorization', '').partition(' ')
+    return bool(token) and scheme.lower() == 'bearer' and hmac.compare_digest(given.strip(), token)
+
+
+@csrf_exempt   # 브라우저 폼이 아니라 Bearer 토큰으로 인증하는 서버 간 API
+@require_POST
+def signup_batch(request):
+    """일괄 가입 (JSON 배열 / NDJSON) → 레코드별 결과를 NDJSON 으로 스트리밍"""
+    if not _api_token_ok(request):
+        return JsonResponse({'error': 'invalid or missing API token'}, status=401)
+    try:
+        records = parse_records(request.body, request.content_type or '')
+    except BatchError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
+    return StreamingHttpResponse(iter_ndjson(records), content_type='application/x-ndjson')
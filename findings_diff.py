@@ -0,0 +1,147 @@
+import os
+import re
+import csv
+import sys
+import hashlib
+import argparse
+from collections import Counter
+from urllib.parse import urlsplit, parse_qsl
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, "metrics_output")
+DETAILED_CSV_PATH = os.path.join(OUTPUT_DIR, "metrics_detailed.csv")
+
+_WS_RE = re.compile(r"\s+")
+_LINE_SUFFIX_RE = re.compile(r":\d+$")
+
+# -------------------- fingerprint -------------------- #
+
+def _normalize_url(url):
+    """scheme/host 소문자, query 는 파라미터 이름만(정렬), fragment 제거"""
+    parts = urlsplit(url.strip())
+    names = sorted({k for k, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    path = parts.path.rstrip("/") or "/"
+    norm = f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+    if names:
+        norm += "?" + "&".join(names)
+    return norm
+
+
+def normalize_target(tool, target, location=""):
+    """
+    run 마다 흔들리는 부분(줄 번호, query 값)을 제거한 위치 문자열.
+    - tfsec/sonarcloud: 파일 경로만 (줄 번호는 코드 수정으로 쉽게 바뀜)
+    - zap: 정규화된 URL + method/param
+    """
+    target = (target or "").strip()
+    if tool == "zap":
+        return f"{_normalize_url(target)} {(location or '').strip()}".strip()
+    return _LINE_SUFFIX_RE.sub("", target).replace("\\", "/")
+
+
+def finding_fingerprint(d):
+    """tool + rule_id + 정규화 위치 + message 해시 → 안정적인 16자리 id (severity 는 제외)"""
+    tool = (d.get("tool") or "").lower()
+    message = _WS_RE.sub(" ", d.get("message") or "").strip()
+    msg_hash = hashlib.sha1(message.encode("utf-8")).hexdigest()[:12]
+    key = "\x1f".join([
+        tool,
+        str(d.get("rule_id") or ""),
+        normalize_target(tool, d.get("target"), d.get("location")),
+        msg_hash,
+    ])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def dedupe_findings(details):
+    """같은 fingerprint 는 한 번만 (순서 유지)"""
+    seen = set()
+    unique = []
+    for d in details:
+        fp = d.get("fingerprint") or finding_fingerprint(d)
+        if fp in seen:
+            continue
+        seen.add(fp)
+        d["fingerprint"] = fp
+        unique.append(d)
+    return unique
+
+# -------------------- diff -------------------- #
+
+def load_detailed_csv(csv_path):
+    """상세 CSV → finding 리스트 (fingerprint 컬럼이 없는 예전 CSV 도 지원)"""
+    rows = []
+    with open(csv_path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            if not row.get("fingerprint"):
+                row["fingerprint"] = finding_fingerprint(row)
+            rows.append(row)
+    return rows
+
+
+def diff_findings(baseline, current):
+    """
+    fingerprint 해시 조인으로 O(n + m) 비교.
+    같은 fingerprint 가 여러 번 나오면 개수 차이만큼 new/fixed 로 본다.
+    반환: (new, fixed, unchanged) — 각각 finding 리스트
+    """
+    base_left = Counter(d["fingerprint"] for d in baseline)
+    cur_left = Counter(d["fingerprint"] for d in current)
+
+    new, unchanged = [], []
+    for d in current:
+        fp = d["fingerprint"]
+        if base_left[fp] > 0:
+            base_left[fp] -= 1
+            unchanged.append(d)
+        else:
+            new.append(d)
+
+    fixed = []
+    for d in baseline:
+        fp = d["fingerprint"]
+        if cur_left[fp] > 0:
+            cur_left[fp] -= 1
+        else:
+            fixed.append(d)
+
+    return new, fixed, unchanged
+
+
+DIFF_COLUMNS = ["fingerprint", "tool", "severity", "rule_id", "target", "location", "message"]
+
+
+def write_diff_csv(rows, csv_path):
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=DIFF_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="baseline 대비 new / fixed / unchanged finding 비교")
+    parser.add_argument("baseline", help="이전 run 의 metrics_detailed.csv")
+    parser.add_argument("current", nargs="?", default=DETAILED_CSV_PATH, help="비교 대상 (기본: 이번 run)")
+    parser.add_argument("--out-dir", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    for path in (args.baseline, args.current):
+        if not os.path.exists(path):
+            print(f"[Diff] 파일 없음: {path}")
+            return 1
+
+    new, fixed, unchanged = diff_findings(load_detailed_csv(args.baseline), load_detailed_csv(args.current))
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for name, rows in (("new", new), ("fixed", fixed), ("unchanged", unchanged)):
+        out_path = os.path.join(args.out_dir, f"findings_{name}.csv")
+        write_diff_csv(rows, out_path)
+        print(f"[Diff] {name}: {len(rows)} → {out_path}")
+
+    for d in new:
+        print(f"  + [{d.get('tool')}/{d.get('severity')}] {d.get('rule_id')} {d.get('target')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# gunicorn 설정 (gunicorn 이 작업 디렉터리의 gunicorn.conf.py 를 자동으로 읽음)
+#
+# GUNICORN_PRELOAD=true → preload 부팅 모드:
+#   master 가 Django 앱을 한 번만 로딩한 뒤 워커를 fork → 워커 부팅이 빨라지고
+#   import 된 모듈 메모리를 copy-on-write 로 공유. 무거운 의존성도 master 에서 미리 import.
+# 기본(false)은 워커마다 앱을 따로 로딩 (코드 reload 가 필요한 개발 환경용).
+import os
+import importlib
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+# 요청 경로에서 처음 import 되는 무거운 모듈 (experiment/dynamo.py, experiment/crypto.py)
+WARM_MODULES = (
+    "boto3",
+    "boto3.dynamodb.conditions",
+    "cryptography.fernet",
+    "cryptography.hazmat.primitives.ciphers.aead",
+    "cryptography.hazmat.primitives.kdf.hkdf",
+)
+
+
+def when_ready(server):
+    # preload 모드에서는 워커 fork 전에 master 에서 미리 import → 첫 요청 지연 없음
+    if not preload_app:
+        return
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    server.log.info("preloaded app and warmed %d module(s)", len(WARM_MODULES))
@@ -21,9 +21,19 @@ variable "region" {
   default     = "us-east-1"
 }
 
+# 쓰기 샤드 수: PK = "role#NN" (NN = crc32(username) % 샤드 수)
+# 앱 설정 DDB_WRITE_SHARDS 와 같은 값이어야 하고, 테이블 수명 동안 바꾸면 안 됨
+variable "signup_write_shards" {
+  description = "Number of write shards per role in thesis-signups-v2 (must match DDB_WRITE_SHARDS)"
+  type        = number
+  default     = 8
+}
+
 ############################################################
-# DynamoDB Table Resource: thesis-signups
+# DynamoDB Table Resource: thesis-signups (LEGACY)
 # - 회원가입 사용자(Employee / Guest) 데이터 저장용
+# - PK=role 이라 쓰기가 파티션 2개에 몰림 → 아래 thesis-signups-v2 로 이전 중
+#   (python manage.py migrate_signups_shards 로 복사 후 이 리소스 제거)
 ############################################################
 
 # 인프라 설계도 (Infrastruture Blueprint)
@@ -44,6 +54,22 @@ resource "aws_dynamodb_table" "signups" {
     name = "username"
     type = "S"
   }
+  attribute {
+    name = "created_day"                   # 가입 날짜 bucket (UTC, YYYY-MM-DD)
+    type = "S"
+  }
+  attribute {
+    name = "created_at"                    # UTC ISO 타임스탬프 (문자열 정렬 = 시간 정렬)
+    type = "S"
+  }
+
+  # 시간 범위 조회용 GSI: "최근 1시간 가입자" 를 Scan 대신 Query 로 (이전 전까지 유지)
+  global_secondary_index {
+    name            = "created_day-created_at-index"
+    hash_key        = "created_day"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
 
   ##########################################################
   # 보안 및 복구 설정 (Secure Version)
@@ -68,6 +94,66 @@ resource "aws_dynamodb_table" "signups" {
   }
 }
 
+############################################################
+# DynamoDB Table Resource: thesis-signups-v2 (쓰기 샤딩)
+# - PK = role#NN, 시간 범위 GSI PK = YYYY-MM-DD#NN
+#   → 가입이 몰려도 쓰기가 role 당 signup_write_shards 개 파티션으로 분산
+# - 읽기는 experiment/dynamo.py 가 샤드별 Query 를 병렬로 실행해서 병합
+############################################################
+
+resource "aws_dynamodb_table" "signups_sharded" {
+  name         = "thesis-signups-v2"
+  billing_mode = "PAY_PER_REQUEST"
+
+  hash_key  = "pk"                         # PK: role#NN (예: guest#03)
+  range_key = "username"                   # SK: 사용자명
+
+  attribute {
+    name = "pk"
+    type = "S"
+  }
+  attribute {
+    name = "username"
+    type = "S"
+  }
+  attribute {
+    name = "created_shard"                 # 날짜 bucket + 샤드 (UTC, YYYY-MM-DD#NN)
+    type = "S"
+  }
+  attribute {
+    name = "created_at"                    # UTC ISO 타임스탬프 (문자열 정렬 = 시간 정렬)
+    type = "S"
+  }
+
+  # 시간 범위 조회용 GSI (experiment/dynamo.py 의 CREATED_INDEX 와 이름 동일)
+  global_secondary_index {
+    name            = "created_shard-created_at-index"
+    hash_key        = "created_shard"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
+  point_in_time_recovery {
+    enabled = true
+  }
+
+  server_side_encryption {
+    enabled = true
+  }
+
+  tags = {
+    Project     = "thesis"
+    Purpose     = "signups"
+    Security    = "enabled"
+    WriteShards = tostring(var.signup_write_shards)
+  }
+}
+
+output "signups_table_name" {
+  value       = aws_dynamodb_table.signups_sharded.name
+  description = "DynamoDB table for signups (DDB_TABLE_SIGNUPS)"
+}
+
 ############################################################
 # S3 Bucket: devsecops-thesis-artifacts (reports & charts)
 # - 11월 7일: 보안 리포트 저장용 버킷 생성
@@ -15,7 +15,13 @@ def main():
             "available on your PYTHONPATH environment variable? Did you "
             "forget to activate a virtual environment?"
         ) from exc
-    execute_from_command_line(sys.argv)
+
+    # python manage.py <command> --profile[=cprofile|tracemalloc]  (또는 THESIS_PROFILE 환경변수)
+    import profile_hooks
+    profile_mode, argv = profile_hooks.pop_profile_flag(sys.argv)
+    command = argv[1] if len(argv) > 1 else "help"
+    with profile_hooks.profiled(f"manage-{command}", profile_mode):
+        execute_from_command_line(argv)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,189 @@
+import os
+import sys
+import sqlite3
+import argparse
+from datetime import datetime, timezone
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, "metrics_output")
+
+# 실행(run)마다 누적되는 히스토리 DB (metrics.csv 는 매번 덮어쓰기 됨)
+HISTORY_DB_PATH = os.getenv("METRICS_HISTORY_DB", os.path.join(OUTPUT_DIR, "history.sqlite3"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_seq    INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id     TEXT NOT NULL UNIQUE,
+    commit_sha TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL
+);
+
+-- run x tool x severity 원본 집계
+CREATE TABLE IF NOT EXISTS severity_counts (
+    run_seq  INTEGER NOT NULL REFERENCES runs(run_seq) ON DELETE CASCADE,
+    tool     TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (run_seq, tool, severity)
+);
+CREATE INDEX IF NOT EXISTS idx_counts_tool_sev_run
+    ON severity_counts (tool, severity, run_seq);
+
+-- 추세 그래프용 롤업: run 이 추가될 때 그 run 만 집계해서 넣는다
+CREATE TABLE IF NOT EXISTS run_totals (
+    run_seq  INTEGER NOT NULL REFERENCES runs(run_seq) ON DELETE CASCADE,
+    severity TEXT NOT NULL,
+    total    INTEGER NOT NULL,
+    PRIMARY KEY (run_seq, severity)
+);
+CREATE INDEX IF NOT EXISTS idx_totals_sev_run
+    ON run_totals (severity, run_seq);
+"""
+
+
+def connect(db_path=HISTORY_DB_PATH):
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def current_run_identity():
+    """CI 환경변수로 (run_id, commit) 결정. 로컬 실행이면 타임스탬프 기반 id."""
+    commit = os.getenv("GITHUB_SHA", "")
+    run_id = os.getenv("GITHUB_RUN_ID")
+    if run_id:
+        attempt = os.getenv("GITHUB_RUN_ATTEMPT", "1")
+        return f"{run_id}.{attempt}", commit
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return f"local-{stamp}", commit
+
+
+def record_run(all_tools_counts, run_id=None, commit="", db_path=HISTORY_DB_PATH):
+    """
+    all_tools_counts: {tool: Counter(severity -> count)}
+    같은 run_id 로 다시 기록하면 run_seq(추세 순서)는 그대로 두고 집계 행만 교체한다.
+    """
+    if run_id is None:
+        run_id, commit = current_run_identity()
+
+    count_rows = []
+    totals = {}
+    for tool, counts in all_tools_counts.items():
+        for sev, n in counts.items():
+            count_rows.append((tool, sev, int(n)))
+            totals[sev] = totals.get(sev, 0) + int(n)
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            # upsert: DELETE + INSERT 하면 AUTOINCREMENT 로 새 run_seq 를 받아 추세 맨 끝으로 밀려남
+            conn.execute(
+                "INSERT INTO runs (run_id, commit_sha, created_at) VALUES (?, ?, ?)"
+                " ON CONFLICT (run_id) DO UPDATE SET commit_sha = excluded.commit_sha",
+                (run_id, commit or "", datetime.now(timezone.utc).isoformat()),
+            )
+            (run_seq,) = conn.execute("SELECT run_seq FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            conn.execute("DELETE FROM severity_counts WHERE run_seq = ?", (run_seq,))
+            conn.execute("DELETE FROM run_totals WHERE run_seq = ?", (run_seq,))
+            conn.executemany(
+                "INSERT INTO severity_counts (run_seq, tool, severity, count) VALUES (?, ?, ?, ?)",
+                [(run_seq, tool, sev, n) for tool, sev, n in count_rows],
+            )
+            # 이 run 하나만 집계 → 다른 run 은 다시 계산하지 않음
+            conn.executemany(
+                "INSERT INTO run_totals (run_seq, severity, total) VALUES (?, ?, ?)",
+                [(run_seq, sev, total) for sev, total in totals.items()],
+            )
+    finally:
+        conn.close()
+
+    print(f"[History] run 기록 완료: {run_id} (seq={run_seq})")
+    return run_seq
+
+
+# -------------------- 추세 조회 -------------------- #
+
+def _recent_runs(conn, last_n):
+    """최근 N 개 run 을 오래된 순으로 [(run_seq, run_id, commit_sha)]"""
+    rows = conn.execute(
+        "SELECT run_seq, run_id, commit_sha FROM runs ORDER BY run_seq DESC LIMIT ?",
+        (last_n,),
+    ).fetchall()
+    rows.reverse()
+    return rows
+
+
+def tool_trend(tool, severity, last_n=50, db_path=HISTORY_DB_PATH):
+    """(tool, severity) 한 쌍의 run 별 count. (tool, severity, run_seq) 인덱스만 탄다."""
+    conn = connect(db_path)
+    try:
+        runs = _recent_runs(conn, last_n)
+        if not runs:
+            return []
+        first_seq = runs[0][0]
+        counts = dict(conn.execute(
+            "SELECT run_seq, count FROM severity_counts"
+            " WHERE tool = ? AND severity = ? AND run_seq >= ?",
+            (tool, severity, first_seq),
+        ).fetchall())
+        return [(run_id, commit, counts.get(seq, 0)) for seq, run_id, commit in runs]
+    finally:
+        conn.close()
+
+
+def severity_trend(last_n=50, db_path=HISTORY_DB_PATH):
+    """
+    최근 N 개 run 의 severity 별 합계 (전체 툴 합산).
+    반환: (run_ids, {severity: [total, ...]})  — 리스트 순서는 run_ids 와 동일
+    """
+    conn = connect(db_path)
+    try:
+        runs = _recent_runs(conn, last_n)
+        if not runs:
+            return [], {}
+        index = {seq: i for i, (seq, _, _) in enumerate(runs)}
+        series = {}
+        for seq, sev, total in conn.execute(
+            "SELECT run_seq, severity, total FROM run_totals WHERE run_seq >= ?",
+            (runs[0][0],),
+        ):
+            series.setdefault(sev, [0] * len(runs))[index[seq]] = total
+        return [run_id for _, run_id, _ in runs], series
+    finally:
+        conn.close()
+
+
+# -------------------- CLI -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보안 지표 히스토리 추세 조회")
+    parser.add_argument("--db", default=HISTORY_DB_PATH)
+    parser.add_argument("--last", type=int, default=20, help="최근 N 개 run")
+    parser.add_argument("--tool", help="특정 툴만 (예: tfsec)")
+    parser.add_argument("--severity", help="--tool 과 함께 사용 (예: HIGH)")
+    args = parser.parse_args(argv)
+
+    if args.tool:
+        if not args.severity:
+            parser.error("--tool 사용 시 --severity 도 필요합니다")
+        for run_id, commit, count in tool_trend(args.tool, args.severity.upper(), args.last, args.db):
+            print(f"{run_id}\t{commit[:7]}\t{count}")
+        return 0
+
+    run_ids, series = severity_trend(args.last, args.db)
+    if not run_ids:
+        print("[History] 기록된 run 없음")
+        return 0
+    severities = sorted(series)
+    print("\t".join(["run_id"] + severities))
+    for i, run_id in enumerate(run_ids):
+        print("\t".join([run_id] + [str(series[sev][i]) for sev in severities]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
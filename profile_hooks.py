@@ -0,0 +1,143 @@
+import os
+import re
+import sys
+import time
+import hashlib
+import itertools
+import threading
+import contextlib
+
+# cProfile / pstats / tracemalloc 는 실제로 프로파일할 때만 import
+# (manage.py 가 매번 이 모듈을 import 하므로 비활성 시 비용 0 유지)
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+PROFILE_DIR = os.path.join(BASE_DIR, "metrics_output", "profiles")
+
+# THESIS_PROFILE=cprofile | tracemalloc  (비어 있으면 프로파일링 안 함)
+# 흔한 이름(PROFILE 등)은 다른 도구/셸 설정이 쓰고 있을 수 있어서 prefix 를 붙임
+ENV_VAR = "THESIS_PROFILE"
+MODES = ("cprofile", "tracemalloc")
+TOP_N = int(os.getenv("THESIS_PROFILE_TOP_N", "30"))
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+# 요청 경로 등 외부 입력이 그대로 파일 이름이 되므로 길이 제한 (넘으면 앞부분 + 전체의 짧은 hash)
+SLUG_MAX = 80
+# tracemalloc 은 프로세스 전역이라 동시에 하나만
+_tracemalloc_lock = threading.Lock()
+_seq = itertools.count()
+
+
+def _out_path(name, ext):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    slug = _SLUG_RE.sub("_", name).strip("_") or "run"
+    if len(slug) > SLUG_MAX:
+        digest = hashlib.sha1(slug.encode("utf-8")).hexdigest()[:8]
+        slug = f"{slug[:SLUG_MAX - 9]}-{digest}"
+    return os.path.join(PROFILE_DIR, f"{slug}-{stamp}-{os.getpid()}-{next(_seq)}.{ext}")
+
+
+def pop_profile_flag(argv):
+    """argv 에서 --profile[=mode] 를 빼고 (mode, 나머지 argv) 반환. 플래그 없으면 THESIS_PROFILE 환경변수."""
+    mode = os.getenv(ENV_VAR, "")
+    rest = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--profile":
+            # 다음 인자가 mode 이름일 때만 값으로 소비 (기본 cprofile)
+            if i + 1 < len(argv) and argv[i + 1].lower() in MODES:
+                mode = argv[i + 1]
+                i += 1
+            else:
+                mode = "cprofile"
+        elif arg.startswith("--profile="):
+            mode = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+        i += 1
+    return mode.lower(), rest
+
+
+def _write_cprofile(prof, name):
+    import io
+    import pstats
+
+    path = _out_path(name, "prof")
+    prof.dump_stats(path)
+    buf = io.StringIO()
+    pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(TOP_N)
+    with open(path[:-len(".prof")] + ".txt", "w") as f:
+        f.write(buf.getvalue())
+    print(f"[profile] cProfile 저장: {path}")
+
+
+def _write_tracemalloc(snapshot, peak, name):
+    path = _out_path(name, "alloc.txt")
+    stats = snapshot.statistics("lineno")
+    with open(path, "w") as f:
+        f.write(f"peak: {peak / (1024 * 1024):.2f} MiB\n")
+        f.write(f"top {TOP_N} allocations by line:\n")
+        for stat in stats[:TOP_N]:
+            f.write(f"{stat}\n")
+    print(f"[profile] tracemalloc 저장: {path}")
+
+
+def _save(write, *args):
+    # 디스크가 찼거나 권한이 없어도 프로파일 대상 작업(요청/커맨드)은 그대로 끝나도록 로그만 남김
+    try:
+        write(*args)
+    except Exception as e:
+        print(f"[profile] 결과 저장 실패: {e!r}", file=sys.stderr)
+
+
+@contextlib.contextmanager
+def profiled(name, mode=None):
+    """
+    with profiled("analyze_security"): ...
+    mode 가 비어 있으면 아무것도 하지 않음 (비활성 시 오버헤드 없음).
+    결과: metrics_output/profiles/<name>-<ts>-<pid>-*.{prof,txt,alloc.txt}
+    """
+    mode = (os.getenv(ENV_VAR, "") if mode is None else mode).lower()
+    if not mode:
+        yield
+        return
+    if mode not in MODES:
+        # 프로파일링은 부가 기능이므로 잘못된 값 때문에 본 작업이 죽지 않게 경고만
+        print(f"[profile] unknown profile mode {mode!r} (choose from {', '.join(MODES)}) — profiling disabled",
+              file=sys.stderr)
+        yield
+        return
+
+    if mode == "cprofile":
+        import cProfile
+
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            _save(_write_cprofile, prof, name)
+        return
+
+    # tracemalloc: 이미 다른 쪽에서 추적 중이면 건너뜀
+    import tracemalloc
+
+    if not _tracemalloc_lock.acquire(blocking=False):
+        yield
+        return
+    try:
+        if tracemalloc.is_tracing():
+            yield
+            return
+        tracemalloc.start(10)
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _save(_write_tracemalloc, snapshot, peak, name)
+    finally:
+        _tracemalloc_lock.release()
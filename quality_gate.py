@@ -1,8 +1,14 @@
 import os
+import re
 import csv
 import sys
+import json
+import fnmatch
+import argparse
 from collections import Counter
 
+from findings_diff import finding_fingerprint
+
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 OUTPUT_DIR = os.path.join(BASE_DIR, "metrics_output")
 
@@ -11,7 +17,12 @@ CSV_PATH = os.path.join(OUTPUT_DIR, "metrics.csv")
 # 상세 CSV (툴/룰/메시지까지)
 DETAILED_CSV_PATH = os.path.join(OUTPUT_DIR, "metrics_detailed.csv")
 
-BLOCKING_SEVERITIES = ["CRITICAL", "HIGH"]  # 여기서 정책 조정 가능
+# 차단 severity / 예외(allowlist) 정책 파일 — 여기서 정책 조정 가능
+POLICY_PATH = os.getenv("QUALITY_POLICY", os.path.join(BASE_DIR, "quality_policy.json"))
+
+DEFAULT_BLOCKING_SEVERITIES = ["CRITICAL", "HIGH"]
+
+_LINE_SUFFIX_RE = re.compile(r":\d+$")
 
 
 def load_counts_from_csv(csv_path):
@@ -34,77 +45,211 @@ def load_counts_from_csv(csv_path):
     return counts_by_sev
 
 
-ALLOWED_ZAP_HIGH_MESSAGES = [
-    'Server Leaks Version Information via "Server" HTTP Response Header Field',
-    "CSP: Failure to Define Directive with No Fallback",
-    "GET for POST",
-]
-
-ALLOWED_SONARCLOUD_CRITICAL_MESSAGES = [
-    "Cognitive Complexity",
-    "This loop's stop condition tests",
-]
-
-
-def subtract_allowed_exceptions(detailed_csv_path, original_count):
+# -------------------- 정책 컴파일 -------------------- #
+
+def _canonical_tool(tool):
+    tool = (tool or "").lower()
+    # sonarcloud, sonar 등 모두 같은 툴로 취급
+    if tool.startswith("sonar"):
+        return "sonarcloud"
+    return tool
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class AllowRule:
+    """정책 파일의 allow 항목 하나 (rule_id / path glob 조건은 미리 컴파일)"""
+
+    def __init__(self, index, spec):
+        self.index = index
+        self.name = spec.get("name") or f"allow[{index}]"
+        self.tools = [_canonical_tool(t) for t in _as_list(spec.get("tool", "*"))]
+        self.severities = [s.upper() for s in _as_list(spec.get("severity", "*"))]
+        self.rule_ids = frozenset(str(r) for r in _as_list(spec.get("rule_ids")))
+        self.messages = _as_list(spec.get("messages"))
+        globs = _as_list(spec.get("paths"))
+        self.path_re = re.compile("|".join(fnmatch.translate(g) for g in globs)) if globs else None
+
+    def matches_rest(self, rule_id, path):
+        """message 이외의 조건 확인"""
+        if self.rule_ids and rule_id not in self.rule_ids:
+            return False
+        if self.path_re is not None and not self.path_re.match(path):
+            return False
+        return True
+
+
+class _Bucket:
+    """(tool, severity) 하나에 걸린 규칙들 + message 부분문자열 전체를 합친 사전 필터 정규식"""
+
+    def __init__(self):
+        self.rules = []
+        self.message_re = None
+
+    def finalize(self):
+        # 합친 정규식은 "어느 문자열이든 하나라도 들어있나" 만 판단 (겹치거나 접두사 관계인
+        # 문자열은 finditer 가 놓치므로 규칙별 hit 판정에는 쓰지 않음)
+        messages = sorted({m for rule in self.rules for m in rule.messages}, key=len, reverse=True)
+        if messages:
+            self.message_re = re.compile("|".join(re.escape(m) for m in messages))
+
+    def match(self, message, rule_id, path):
+        has_message = self.message_re is not None and self.message_re.search(message) is not None
+        for rule in self.rules:
+            if rule.messages and not (has_message and any(m in message for m in rule.messages)):
+                continue
+            if rule.matches_rest(rule_id, path):
+                return rule
+        return None
+
+
+class CompiledPolicy:
+    def __init__(self, blocking_severities, rules):
+        self.blocking = frozenset(s.upper() for s in blocking_severities)
+        self.rules = rules
+        self.buckets = {}
+        for rule in rules:
+            for tool in rule.tools:
+                for sev in rule.severities:
+                    self.buckets.setdefault((tool, sev), _Bucket()).rules.append(rule)
+        for bucket in self.buckets.values():
+            bucket.finalize()
+
+    def _candidate_buckets(self, tool, sev):
+        for key in ((tool, sev), (tool, "*"), ("*", sev), ("*", "*")):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                yield bucket
+
+    def waiver_for(self, finding):
+        """finding 을 면제하는 AllowRule (없으면 None). 여러 개면 정책 파일에서 먼저 나온 것."""
+        tool = _canonical_tool(finding.get("tool"))
+        sev = (finding.get("severity") or "").upper()
+        message = finding.get("message") or ""
+        rule_id = str(finding.get("rule_id") or "")
+        path = _LINE_SUFFIX_RE.sub("", (finding.get("target") or "").strip())
+
+        best = None
+        for bucket in self._candidate_buckets(tool, sev):
+            rule = bucket.match(message, rule_id, path)
+            if rule is not None and (best is None or rule.index < best.index):
+                best = rule
+        return best
+
+
+def compile_policy(policy):
+    rules = [AllowRule(i, spec) for i, spec in enumerate(policy.get("allow") or [])]
+    return CompiledPolicy(policy.get("blocking_severities") or DEFAULT_BLOCKING_SEVERITIES, rules)
+
+
+def load_policy(policy_path=POLICY_PATH):
+    if not os.path.exists(policy_path):
+        print(f"[Quality Gate] 정책 파일 없음: {policy_path} → 예외 없이 {DEFAULT_BLOCKING_SEVERITIES} 차단")
+        return compile_policy({})
+    with open(policy_path, "r") as f:
+        return compile_policy(json.load(f))
+
+
+# -------------------- 평가 -------------------- #
+
+def iter_detailed_csv(detailed_csv_path):
+    with open(detailed_csv_path, "r", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def evaluate_findings(findings, policy):
     """
-    ZAP HIGH 예외 + SonarCloud CRITICAL (staticfiles/admin/js) 예외를 차감한다.
+    finding 스트림을 한 번만 훑어서 차단 대상 / 면제 대상을 나눈다.
+    반환: (blocking_total, waived)  — waived: [(AllowRule, finding), ...]
     """
-    if original_count <= 0:
-        return original_count
-
-    if not os.path.exists(detailed_csv_path):
-        return original_count
-
-    adjusted = original_count  # 여기서부터 차감
-
-    with open(detailed_csv_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            tool = (row.get("tool") or "").lower()
-            severity = (row.get("severity") or "").upper()
-            message = row.get("message", "") or ""
-            file_path = row.get("file", "") or ""
-
-            # 1) ZAP HIGH 예외
-            if (
-                tool == "zap"
-                and severity == "HIGH"
-                and any(allowed in message for allowed in ALLOWED_ZAP_HIGH_MESSAGES)
-            ):
-                adjusted -= 1
-                continue
-
-            # 2) SonarCloud CRITICAL + staticfiles/admin/js 예외
-            if (
-                tool.startswith("sonar")        # sonarcloud, sonar 등 모두 허용
-                and severity == "CRITICAL"
-                and any(allowed in message for allowed in ALLOWED_SONARCLOUD_CRITICAL_MESSAGES)
-            ):
-                adjusted -= 1
-
-    return max(adjusted, 0), (original_count - adjusted)
-
-
-def main():
-    counts_by_sev = load_counts_from_csv(CSV_PATH)
+    blocking_total = 0
+    waived = []
+    for finding in findings:
+        if (finding.get("severity") or "").upper() not in policy.blocking:
+            continue
+        rule = policy.waiver_for(finding)
+        if rule is None:
+            blocking_total += 1
+        else:
+            waived.append((rule, finding))
+    return blocking_total, waived
+
+
+def build_verdict(all_tools_counts, findings, policy):
+    """
+    메모리상의 집계/finding 으로 바로 게이트 판정 (CSV 왕복 없음).
+    all_tools_counts: {tool: Counter(severity -> count)}
+    반환: JSON 으로 직렬화 가능한 dict
+    """
+    blocking_total, waived = evaluate_findings(findings, policy)
+    return {
+        "passed": blocking_total == 0,
+        "blocking_severities": sorted(policy.blocking),
+        "blocking_total": blocking_total,
+        "waived_total": len(waived),
+        "counts": {tool: dict(counts) for tool, counts in all_tools_counts.items()},
+        "waivers": [
+            {
+                "rule": rule.name,
+                "tool": f.get("tool", ""),
+                "severity": f.get("severity", ""),
+                "rule_id": f.get("rule_id", ""),
+                "target": f.get("target", ""),
+                "fingerprint": f.get("fingerprint") or finding_fingerprint(f),
+            }
+            for rule, f in waived
+        ],
+    }
+
+
+def print_waivers(waived):
+    for rule, f in waived:
+        print(f"  ↳ waived by '{rule.name}': [{f.get('tool')}/{f.get('severity')}] "
+              f"{f.get('rule_id')} {f.get('target')} — {f.get('message')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보안 지표 Quality Gate")
+    parser.add_argument("--policy", default=POLICY_PATH)
+    parser.add_argument("--csv", default=CSV_PATH)
+    parser.add_argument("--detailed", default=DETAILED_CSV_PATH)
+    args = parser.parse_args(argv)
+
+    policy = load_policy(args.policy)
+    blocking_severities = sorted(policy.blocking)
+
+    counts_by_sev = load_counts_from_csv(args.csv)
     print("[Quality Gate] 전체 severity 집계:", dict(counts_by_sev))
 
-    # 차단 대상 severity 합계 계산
-    blocking_total = sum(counts_by_sev.get(sev, 0) for sev in BLOCKING_SEVERITIES)
+    if os.path.exists(args.detailed):
+        # 상세 CSV 를 스트리밍으로 한 번 훑으면서 예외 처리 적용
+        blocking_total, waived = evaluate_findings(iter_detailed_csv(args.detailed), policy)
+    else:
+        blocking_total = sum(counts_by_sev.get(sev, 0) for sev in blocking_severities)
+        waived = []
 
-    # 예외 처리 적용
-    blocking_total, exceptions_applied = subtract_allowed_exceptions(DETAILED_CSV_PATH, blocking_total)
+    print_waivers(waived)
 
     if blocking_total > 0:
-        print(f"❌ Quality Gate FAILED: {BLOCKING_SEVERITIES} Total = {blocking_total}")
+        print(f"❌ Quality Gate FAILED: {blocking_severities} Total = {blocking_total}")
         print("Please check regarding issues to deploy successfully!!!!!")
         sys.exit(1)
     else:
-        print("✅ Quality Gate PASSED: No blocking severity (after applying", exceptions_applied, "exception(s))")
+        print("✅ Quality Gate PASSED: No blocking severity (after applying", len(waived), "exception(s))")
         print("This version has no blocking vulnerabilities. It can be deployed right now ^^.")
         sys.exit(0)
 
 
 if __name__ == "__main__":
-    main()
+    import profile_hooks
+
+    # --profile[=cprofile|tracemalloc] 또는 THESIS_PROFILE 환경변수
+    profile_mode, sys.argv[1:] = profile_hooks.pop_profile_flag(sys.argv[1:])
+    with profile_hooks.profiled("quality_gate", profile_mode):
+        main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import json
+import argparse
+import contextlib
+
+import analyze_security
+import quality_gate
+
+# analyze_security.py + quality_gate.py 를 한 프로세스에서 실행
+# (metrics.csv / metrics_detailed.csv 를 쓰고 다시 파싱하는 왕복 없이 메모리에서 바로 판정)
+
+
+def run(reports_dir=analyze_security.REPORTS_DIR, policy_path=quality_gate.POLICY_PATH,
+        write_csvs=False, write_charts=False, record_history=False):
+    """리포트 로드 → (옵션) 부가 산출물 → 게이트 판정. 반환: verdict dict"""
+    all_tools, all_details = analyze_security.collect(reports_dir)
+
+    if write_csvs:
+        analyze_security.write_csvs(all_tools, all_details)
+    if record_history:
+        analyze_security.metrics_history.record_run(all_tools)
+    if write_charts:
+        analyze_security.write_charts(all_tools)
+
+    policy = quality_gate.load_policy(policy_path)
+    return quality_gate.build_verdict(all_tools, all_details, policy)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보안 리포트 분석 + Quality Gate (단일 프로세스)")
+    parser.add_argument("--reports-dir", default=analyze_security.REPORTS_DIR)
+    parser.add_argument("--policy", default=quality_gate.POLICY_PATH)
+    parser.add_argument("--csv", action="store_true", help="metrics.csv / metrics_detailed.csv 도 저장")
+    parser.add_argument("--charts", action="store_true", help="PNG 그래프도 저장")
+    parser.add_argument("--history", action="store_true", help="히스토리 DB 에 run 기록")
+    parser.add_argument("--verdict-json", help="판정 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 진행 로그는 stderr 로 → stdout 에는 판정 JSON 만 남김
+    with contextlib.redirect_stdout(sys.stderr):
+        verdict = run(
+            reports_dir=args.reports_dir,
+            policy_path=args.policy,
+            write_csvs=args.csv,
+            write_charts=args.charts,
+            record_history=args.history,
+        )
+        for w in verdict["waivers"]:
+            print(f"  ↳ waived by '{w['rule']}': [{w['tool']}/{w['severity']}] {w['rule_id']} {w['target']}")
+
+    if args.verdict_json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.verdict_json)), exist_ok=True)
+        with open(args.verdict_json, "w") as f:
+            json.dump(verdict, f, indent=2, ensure_ascii=False)
+
+    print(json.dumps(verdict, ensure_ascii=False))
+
+    if verdict["passed"]:
+        print("✅ Quality Gate PASSED", file=sys.stderr)
+        return 0
+    print(f"❌ Quality Gate FAILED: {verdict['blocking_severities']} Total = {verdict['blocking_total']}",
+          file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    import profile_hooks
+
+    # --profile[=cprofile|tracemalloc] 또는 THESIS_PROFILE 환경변수
+    profile_mode, sys.argv[1:] = profile_hooks.pop_profile_flag(sys.argv[1:])
+    with profile_hooks.profiled("security_pipeline", profile_mode):
+        exit_code = main()
+    sys.exit(exit_code)
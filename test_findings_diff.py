@@ -0,0 +1,73 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import analyze_security
+from findings_diff import dedupe_findings, diff_findings, finding_fingerprint
+
+
+def finding(tool="tfsec", target="main.tf:10", rule_id="AVD-AWS-0086", message="Bucket is public", **extra):
+    d = {"tool": tool, "severity": "HIGH", "rule_id": rule_id, "target": target, "location": "", "message": message}
+    d.update(extra)
+    d["fingerprint"] = finding_fingerprint(d)
+    return d
+
+
+class FingerprintTests(unittest.TestCase):
+    def test_line_number_change_is_unchanged(self):
+        for tool, before, after in (("tfsec", "infra/main.tf:10", "infra/main.tf:42"),
+                                    ("sonarcloud", "experiment\\views.py:7", "experiment/views.py:19")):
+            new, fixed, unchanged = diff_findings([finding(tool, before)], [finding(tool, after)])
+            self.assertEqual((len(new), len(fixed), len(unchanged)), (0, 0, 1), tool)
+
+    def test_different_file_is_new_and_fixed(self):
+        new, fixed, unchanged = diff_findings([finding(target="a.tf:1")], [finding(target="b.tf:1")])
+        self.assertEqual((len(new), len(fixed), len(unchanged)), (1, 1, 0))
+
+    def test_repeated_zap_instances_collapse(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        os.makedirs(os.path.join(tmp, "zap-report"))
+        alert = {
+            "name": "SQL Injection", "pluginId": "40018", "riskdesc": "High (Medium)",
+            "instances": [
+                {"uri": "http://App.local/search?q=1&page=2", "method": "get", "param": "q"},
+                {"uri": "http://app.local/search/?page=9&q=other#top", "method": "GET", "param": "q"},
+                {"uri": "http://app.local/search?q=1", "method": "POST", "param": "q"},
+            ],
+        }
+        # 같은 alert 가 여러 site 에 반복돼도 한 번만
+        report = {"site": [{"alerts": [alert]}, {"alerts": [alert]}]}
+        with open(os.path.join(tmp, "zap-report", "report_json.json"), "w") as f:
+            json.dump(report, f)
+
+        with redirect_stdout(StringIO()):
+            counts, details = analyze_security.load_zap(tmp)
+        # GET q (query 값/순서/fragment/대소문자만 다름) 1개 + POST q 1개
+        self.assertEqual(counts, {"HIGH": 2})
+        self.assertEqual(sorted(d["location"] for d in details), ["GET q", "POST q"])
+
+    def test_dedupe_keeps_first_occurrence(self):
+        first, second = finding(target="x.tf:1"), finding(target="x.tf:2")
+        self.assertEqual(dedupe_findings([first, second]), [first])
+
+
+class DiffMultiplicityTests(unittest.TestCase):
+    def test_duplicate_fingerprints_are_counted(self):
+        baseline = [finding(target="main.tf:1"), finding(target="main.tf:2")]
+        current = [finding(target="main.tf:3"), finding(target="main.tf:4"), finding(target="main.tf:5")]
+        new, fixed, unchanged = diff_findings(baseline, current)
+        self.assertEqual((len(new), len(fixed), len(unchanged)), (1, 0, 2))
+        self.assertIs(new[0], current[2])
+
+        new, fixed, unchanged = diff_findings(current, baseline)
+        self.assertEqual((len(new), len(fixed), len(unchanged)), (0, 1, 2))
+        self.assertIs(fixed[0], current[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
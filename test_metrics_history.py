@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from contextlib import redirect_stdout
+from io import StringIO
+
+import metrics_history
+
+
+class MetricsHistoryTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        self.db = os.path.join(tmp, "history.sqlite3")
+
+    def record(self, run_id, counts, commit=""):
+        with redirect_stdout(StringIO()):
+            return metrics_history.record_run(counts, run_id=run_id, commit=commit, db_path=self.db)
+
+    def test_record_and_trend(self):
+        self.record("1.1", {"tfsec": Counter(HIGH=2, LOW=1), "zap": Counter(HIGH=1)}, commit="abc1234")
+        self.record("2.1", {"tfsec": Counter(HIGH=1)})
+
+        run_ids, series = metrics_history.severity_trend(db_path=self.db)
+        self.assertEqual(run_ids, ["1.1", "2.1"])
+        self.assertEqual(series, {"HIGH": [3, 1], "LOW": [1, 0]})
+        self.assertEqual(metrics_history.tool_trend("zap", "HIGH", db_path=self.db),
+                         [("1.1", "abc1234", 1), ("2.1", "", 0)])
+
+    def test_rerecord_keeps_run_position(self):
+        first = self.record("1.1", {"tfsec": Counter(HIGH=5)})
+        self.record("2.1", {"tfsec": Counter(HIGH=1)})
+        again = self.record("1.1", {"tfsec": Counter(LOW=2)}, commit="def5678")
+
+        self.assertEqual(again, first)
+        run_ids, series = metrics_history.severity_trend(db_path=self.db)
+        self.assertEqual(run_ids, ["1.1", "2.1"])
+        self.assertEqual(series, {"HIGH": [0, 1], "LOW": [2, 0]})
+        self.assertEqual(metrics_history.tool_trend("tfsec", "LOW", db_path=self.db)[0], ("1.1", "def5678", 2))
+
+    def test_trend_window_returns_last_n_oldest_first(self):
+        for i in range(5):
+            self.record(f"{i}.1", {"tfsec": Counter(HIGH=i)})
+
+        run_ids, series = metrics_history.severity_trend(last_n=3, db_path=self.db)
+        self.assertEqual(run_ids, ["2.1", "3.1", "4.1"])
+        self.assertEqual(series["HIGH"], [2, 3, 4])
+        self.assertEqual([c for _, _, c in metrics_history.tool_trend("tfsec", "HIGH", last_n=2, db_path=self.db)],
+                         [3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+
+import profile_hooks
+
+
+class ProfileHooksTests(unittest.TestCase):
+    def test_generic_profile_env_is_ignored(self):
+        with mock.patch.dict(os.environ, {"PROFILE": "default"}, clear=False):
+            os.environ.pop(profile_hooks.ENV_VAR, None)
+            self.assertEqual(profile_hooks.pop_profile_flag(["check"]), ("", ["check"]))
+
+    def test_profile_flag(self):
+        self.assertEqual(profile_hooks.pop_profile_flag(["--profile", "check"]), ("cprofile", ["check"]))
+        self.assertEqual(profile_hooks.pop_profile_flag(["--profile", "tracemalloc"]), ("tracemalloc", []))
+
+    def test_unknown_mode_warns_and_runs_unprofiled(self):
+        ran = []
+        err = io.StringIO()
+        with redirect_stderr(err), profile_hooks.profiled("test", "default"):
+            ran.append(True)
+        self.assertEqual(ran, [True])
+        self.assertIn("unknown profile mode 'default'", err.getvalue())
+
+    def test_long_names_are_truncated_with_hash(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        with mock.patch.object(profile_hooks, "PROFILE_DIR", tmp):
+            a = os.path.basename(profile_hooks._out_path("request-GET-/" + "a" * 5000, "prof"))
+            b = os.path.basename(profile_hooks._out_path("request-GET-/" + "a" * 4999 + "b", "prof"))
+        slug_a, slug_b = a.rsplit("-", 3)[0], b.rsplit("-", 3)[0]   # <slug>-<ts>-<pid>-<seq>.prof
+        self.assertEqual(len(slug_a), profile_hooks.SLUG_MAX)
+        self.assertNotEqual(slug_a, slug_b)
+
+    def test_write_errors_are_logged_not_raised(self):
+        ran = []
+        err = io.StringIO()
+        with mock.patch.object(profile_hooks, "_write_cprofile", side_effect=OSError("disk full")):
+            with redirect_stderr(err), profile_hooks.profiled("test", "cprofile"):
+                ran.append(True)
+        self.assertEqual(ran, [True])
+        self.assertIn("disk full", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from collections import Counter
+
+from quality_gate import build_verdict, compile_policy, evaluate_findings
+
+
+def finding(message, tool="zap", severity="HIGH", rule_id="", target="http://app/"):
+    return {"tool": tool, "severity": severity, "message": message, "rule_id": rule_id, "target": target}
+
+
+class CompilePolicyTests(unittest.TestCase):
+    def test_default_blocking_severities(self):
+        policy = compile_policy({})
+        self.assertEqual(policy.blocking, {"CRITICAL", "HIGH"})
+        self.assertIsNone(policy.waiver_for(finding("anything")))
+
+    def test_overlapping_messages_in_one_bucket(self):
+        # 앞 규칙의 문자열이 뒤 규칙 문자열의 접두사 (앞 규칙은 path 조건 때문에 불일치)
+        policy = compile_policy({"allow": [
+            {"name": "a", "tool": "zap", "severity": "HIGH", "messages": ["GET"], "paths": ["http://other/*"]},
+            {"name": "b", "tool": "zap", "severity": "HIGH", "messages": ["GET for POST"]},
+        ]})
+        self.assertEqual(policy.waiver_for(finding("GET for POST")).name, "b")
+        self.assertEqual(policy.waiver_for(finding("GET for POST", target="http://other/x")).name, "a")
+
+    def test_overlapping_substrings_with_rule_ids(self):
+        policy = compile_policy({"allow": [
+            {"name": "a", "tool": "zap", "severity": "HIGH", "messages": ["Server Leaks"], "rule_ids": ["1"]},
+            {"name": "b", "tool": "zap", "severity": "HIGH", "messages": ["Leaks Version"]},
+        ]})
+        self.assertEqual(policy.waiver_for(finding("Server Leaks Version Information", rule_id="2")).name, "b")
+        self.assertEqual(policy.waiver_for(finding("Server Leaks Version Information", rule_id="1")).name, "a")
+
+    def test_wildcards_and_first_rule_wins(self):
+        policy = compile_policy({"allow": [
+            {"name": "specific", "tool": "sonar", "severity": "CRITICAL", "messages": ["Complexity"]},
+            {"name": "any", "messages": ["Complexity"]},
+        ]})
+        self.assertEqual(policy.waiver_for(finding("Cognitive Complexity", "sonarcloud", "CRITICAL")).name, "specific")
+        self.assertEqual(policy.waiver_for(finding("Cognitive Complexity", "trivy", "HIGH")).name, "any")
+
+    def test_path_glob_ignores_line_suffix(self):
+        policy = compile_policy({"allow": [{"name": "vendor", "paths": ["static/vendor/*"]}]})
+        self.assertIsNotNone(policy.waiver_for(finding("x", target="static/vendor/lib.js:42")))
+        self.assertIsNone(policy.waiver_for(finding("x", target="experiment/views.py:3")))
+
+
+class EvaluateFindingsTests(unittest.TestCase):
+    def setUp(self):
+        self.policy = compile_policy({"allow": [{"name": "get", "tool": "zap", "messages": ["GET for POST"]}]})
+
+    def test_splits_blocking_and_waived(self):
+        findings = [
+            finding("GET for POST"),
+            finding("SQL Injection"),
+            finding("Cookie without flag", severity="LOW"),
+        ]
+        blocking, waived = evaluate_findings(findings, self.policy)
+        self.assertEqual(blocking, 1)
+        self.assertEqual([(rule.name, f["message"]) for rule, f in waived], [("get", "GET for POST")])
+
+    def test_build_verdict(self):
+        verdict = build_verdict({"zap": Counter(HIGH=1)}, [finding("GET for POST")], self.policy)
+        self.assertTrue(verdict["passed"])
+        self.assertEqual(verdict["waived_total"], 1)
+        self.assertEqual(len(verdict["waivers"][0]["fingerprint"]), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
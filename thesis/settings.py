@@ -12,17 +12,53 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 import os # 토클 & 키 세팅 (Secure / Insecure version)
-from dotenv import load_dotenv
-load_dotenv()
+
+# .env 가 있을 때만 python-dotenv 로딩 (운영/CI 처럼 환경변수로 주입하면 import 생략)
+# 예전 find_dotenv() 와 같이 이 파일 위치에서 상위 디렉터리로 올라가며 첫 .env 를 찾는다
+_ENV_FILE = next((d / ".env" for d in Path(__file__).resolve().parents if (d / ".env").is_file()), None)
+if _ENV_FILE is not None:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 ENCRYPTION_ENABLED = os.getenv("ENCRYPTION_ENABLED", "false").lower() == "true"
 FERNET_KEY = os.getenv("FERNET_KEY")
 
+# PII 암호문 형식: aesgcm (기본, "a1:" envelope) | fernet (예전 형식). 복호화는 둘 다 지원
+PII_CIPHER = os.getenv("PII_CIPHER", "aesgcm")
+
 ENCRYPTION_ENABLED = True   # ← 암호화 모드
 # ENCRYPTION_ENABLED = False  # ← 평문 모드
 
+# 요청 프로파일링: 샘플링 비율(0 = 끔) / 모드(cprofile | tracemalloc)
+# PROFILING_HEADER_ENABLED=true 일 때만 X-Profile 헤더로 개별 요청 프로파일 가능
+# (DEBUG 와 분리 — 누구나 헤더로 프로파일 파일을 쌓을 수 있으므로 명시적으로 켤 때만)
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_MODE = os.getenv("PROFILING_MODE", "cprofile")
+PROFILING_HEADER_ENABLED = os.getenv("PROFILING_HEADER_ENABLED", "false").lower() == "true"
+
+# /metrics: 워커별 스냅샷 파일을 모아 합산하는 디렉터리 / flush 주기(초)
+METRICS_DIR = os.getenv("METRICS_DIR", os.path.join(os.getenv("TMPDIR", "/tmp"), "thesis-metrics"))
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+# /stats 응답 캐시 시간(초)
+SIGNUP_STATS_CACHE_SECONDS = int(os.getenv("SIGNUP_STATS_CACHE_SECONDS", "30"))
+
+# 일괄 가입 API (POST /api/signups/batch): Bearer 토큰(비우면 API 끔) / 요청당 최대 레코드 수 /
+# 비밀번호 해싱·암호화 프로세스 수 — gunicorn 워커마다 이만큼 Django 프로세스가 더 뜨므로 기본은 0
+# (요청 처리 프로세스에서 직접). 워커 수가 적고 코어가 남는 호스트에서만 켤 것
+SIGNUP_API_TOKEN = os.getenv("SIGNUP_API_TOKEN", "")
+SIGNUP_BATCH_MAX = int(os.getenv("SIGNUP_BATCH_MAX", "500"))
+SIGNUP_HASH_WORKERS = int(os.getenv("SIGNUP_HASH_WORKERS", "0"))
+
 AWS_REGION = "us-east-1"
-DDB_TABLE_SIGNUPS = "thesis-signups"
+# PK = role#NN 샤드 테이블 (infra/terraform/main.tf 의 signups_sharded).
+# 예전 PK=role 테이블은 migrate_signups_shards 로 옮긴 뒤 제거 예정
+DDB_TABLE_SIGNUPS = os.getenv("DDB_TABLE_SIGNUPS", "thesis-signups-v2")
+DDB_TABLE_SIGNUPS_LEGACY = os.getenv("DDB_TABLE_SIGNUPS_LEGACY", "thesis-signups")
+# 쓰기 샤드 수 — 테이블 수명 동안 고정 (Terraform var.signup_write_shards 와 같은 값)
+DDB_WRITE_SHARDS = int(os.getenv("DDB_WRITE_SHARDS", "8"))
+# 로컬 DynamoDB 대체 서버 (예: DynamoDB Local → http://localhost:8001). 비우면 AWS
+DDB_ENDPOINT_URL = os.getenv("DDB_ENDPOINT_URL", "")
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -56,6 +92,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "experiment.middleware.ProfilingMiddleware", # 요청 프로파일링 (아래 PROFILING_* 참고)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',